@@ -0,0 +1,10 @@
+"""
+Offline benchmark suite for the generation pipeline and output formats
+
+Run with: python -m benchmarks --output results.json
+"""
+
+from benchmarks.profiles import synthetic_profile
+from benchmarks.suite import run_suite
+
+__all__ = ['run_suite', 'synthetic_profile']
\ No newline at end of file
@@ -0,0 +1,37 @@
+"""
+Command line entry point: python -m benchmarks
+"""
+
+import json
+import click
+from benchmarks.suite import OUTPUT_FORMATS, QUICK_SWEEPS, SWEEPS, run_suite
+
+@click.command()
+@click.option('--output', '-o', type=click.Path(dir_okay=False), default=None,
+              help='Write the JSON results to a file (default: stdout)')
+@click.option('--quick', is_flag=True, help='Smaller sweeps for a fast check')
+@click.option('--repeat', type=click.IntRange(min=1), default=3, help='Runs per case; the best is kept (default: 3)')
+@click.option('--no-memory', is_flag=True, help='Skip the tracemalloc pass (it slows generation down)')
+@click.option('--format', '-f', 'formats', type=click.Choice(OUTPUT_FORMATS), multiple=True,
+              help='Output formats to time (default: all)')
+def main(output, quick, repeat, no_memory, formats):
+    """Benchmark generation phases, memory and output formats on synthetic profiles"""
+    
+    def progress(case):
+        click.echo(f"   {case['sweep']:<9} keywords={case['keywords']:<3} hobbies={case['hobbies']:<3} "
+                   f"{case['candidates']:>10,} candidates  {case['generate_seconds']:8.3f}s  "
+                   f"{case['candidates_per_second']:>12,.0f}/s", err=True)
+    
+    results = run_suite(QUICK_SWEEPS if quick else SWEEPS, repeat=repeat, memory=not no_memory,
+                        formats=formats or OUTPUT_FORMATS, progress=progress)
+    
+    encoded = json.dumps(results, indent=2)
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(encoded)
+        click.echo(f"💾 Saved benchmark results to {output}", err=True)
+    else:
+        click.echo(encoded)
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,23 @@
+"""
+Synthetic target profiles of increasing size
+"""
+
+import copy
+import itertools
+from typing import Dict, List
+from modules.utils import create_sample_config
+
+# Syllables combined into made-up words, so synthetic profiles never depend on external data
+_SYLLABLES = ['ka', 'lo', 'mi', 'ren', 'tos', 'vi', 'dar', 'nu', 'pel', 'sor', 'gim', 'fae']
+
+def synthetic_words(count: int, prefix: str = '') -> List[str]:
+    """count distinct, deterministic lowercase words (three syllables each)"""
+    combinations = itertools.product(_SYLLABLES, repeat=3)
+    return [prefix + ''.join(syllables) for syllables in itertools.islice(combinations, count)]
+
+def synthetic_profile(keywords: int = 3, hobbies: int = 3) -> Dict:
+    """The sample configuration with its keywords and hobbies replaced by synthetic ones"""
+    config = copy.deepcopy(create_sample_config())
+    config['personal_info']['keywords'] = synthetic_words(keywords)
+    config['recon_info']['hobbies'] = synthetic_words(hobbies, prefix='x')
+    return config
\ No newline at end of file
@@ -0,0 +1,150 @@
+"""
+Benchmark runs: per-phase generation timing, memory and output throughput
+"""
+
+import multiprocessing
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Tuple
+from modules.generator import WordlistGenerator
+from modules.instrumentation import max_rss_bytes
+from modules.output import OutputManager
+from benchmarks.profiles import synthetic_profile
+
+OUTPUT_FORMATS = ('txt', 'csv', 'json')
+
+# (sweep name, [(keywords, hobbies), ...]); keywords and hobbies both feed the quadratic pair phase
+SWEEPS = [
+    ('profile', [(3, 3), (10, 10), (25, 25), (50, 50)]),
+    ('keywords', [(0, 3), (5, 3), (10, 3), (20, 3), (40, 3), (80, 3)]),
+    ('hobbies', [(3, 0), (3, 5), (3, 10), (3, 20), (3, 40), (3, 80)])
+]
+
+# Smaller sweeps for a quick check
+QUICK_SWEEPS = [
+    ('profile', [(3, 3), (10, 10)]),
+    ('keywords', [(0, 3), (10, 3), (20, 3)]),
+    ('hobbies', [(3, 0), (3, 10), (3, 20)])
+]
+
+def _rate(amount: int, seconds: float) -> float:
+    return round(amount / seconds, 1) if seconds > 0 else 0.0
+
+def time_phases(generator: WordlistGenerator, config: Dict) -> List[Dict]:
+    """Wall time and candidate count of every phase, each stream drained on its own"""
+    personal_info = config['personal_info']
+    options = config['options']
+    base_words = generator._extract_base_words(personal_info, config['social_media'], config['recon_info'])
+    
+    phases = []
+    for name, stream in generator._phase_streams(personal_info, base_words, options):
+        start = time.perf_counter()
+        candidates = sum(1 for _ in stream)
+        seconds = time.perf_counter() - start
+        phases.append({
+            'phase': name,
+            'seconds': round(seconds, 6),
+            'candidates': candidates,
+            'candidates_per_second': _rate(candidates, seconds)
+        })
+    return phases
+
+def time_generate(generator: WordlistGenerator, config: Dict) -> Tuple[Dict, float]:
+    """Full generate() result and its wall time"""
+    start = time.perf_counter()
+    result = generator.generate(
+        personal_info=config['personal_info'],
+        social_media=config['social_media'],
+        recon_info=config['recon_info'],
+        options=config['options']
+    )
+    return result, time.perf_counter() - start
+
+def peak_traced_memory(generator: WordlistGenerator, config: Dict) -> int:
+    """Peak Python heap allocation of one generate() call, measured with tracemalloc"""
+    tracemalloc.start()
+    try:
+        time_generate(generator, config)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def time_outputs(result: Dict, directory: str, formats=OUTPUT_FORMATS) -> Dict[str, Dict]:
+    """Wall time, file size and throughput of saving result in every format"""
+    outputs = {}
+    for format in formats:
+        output_manager = OutputManager(format=format)
+        start = time.perf_counter()
+        output_manager.save_results(dict(result), os.path.join(directory, f'bench-{format}'))
+        seconds = time.perf_counter() - start
+        
+        size = os.path.getsize(output_manager.last_path)
+        os.remove(output_manager.last_path)
+        outputs[format] = {
+            'seconds': round(seconds, 6),
+            'bytes': size,
+            'bytes_per_second': _rate(size, seconds)
+        }
+    return outputs
+
+def run_case(sweep: str, keywords: int, hobbies: int, repeat: int = 1, memory: bool = True,
+             formats=OUTPUT_FORMATS) -> Dict:
+    """Benchmark one synthetic profile; timings are the best of repeat runs"""
+    generator = WordlistGenerator()
+    config = synthetic_profile(keywords, hobbies)
+    
+    phase_runs = [time_phases(generator, config) for _ in range(repeat)]
+    phases = [min(runs, key=lambda phase: phase['seconds']) for runs in zip(*phase_runs)]
+    
+    result, seconds = min((time_generate(generator, config) for _ in range(repeat)), key=lambda run: run[1])
+    
+    with tempfile.TemporaryDirectory(prefix='cyberwordlist-bench-') as directory:
+        outputs = time_outputs(result, directory, formats)
+    
+    return {
+        'sweep': sweep,
+        'keywords': keywords,
+        'hobbies': hobbies,
+        'base_words': result['base_words_count'],
+        'total_before_filter': result['total_before_filter'],
+        'candidates': result['count'],
+        'generate_seconds': round(seconds, 6),
+        'candidates_per_second': _rate(result['count'], seconds),
+        'peak_traced_bytes': peak_traced_memory(generator, config) if memory else None,
+        'max_rss_bytes': max_rss_bytes(),
+        'phases': phases,
+        'outputs': outputs
+    }
+
+def run_isolated(sweep: str, keywords: int, hobbies: int, **kwargs) -> Dict:
+    """run_case in a freshly spawned process, so its peak RSS is not left over from an earlier case"""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+        return executor.submit(run_case, sweep, keywords, hobbies, **kwargs).result()
+
+def run_suite(sweeps=SWEEPS, repeat: int = 1, memory: bool = True, formats=OUTPUT_FORMATS,
+              progress=None, isolate: bool = True) -> Dict:
+    """Run every case of every sweep, each in a fresh process unless isolate is False; progress(case) follows each"""
+    from cyberwordlist import __version__
+    
+    run = run_isolated if isolate else run_case
+    cases = []
+    for sweep, sizes in sweeps:
+        for keywords, hobbies in sizes:
+            case = run(sweep, keywords, hobbies, repeat=repeat, memory=memory, formats=formats)
+            cases.append(case)
+            if progress is not None:
+                progress(case)
+    
+    return {
+        'version': __version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created_at': datetime.now().isoformat(),
+        'repeat': repeat,
+        'cases': cases
+    }
\ No newline at end of file
@@ -8,30 +8,113 @@ License: MIT
 """
 
 import click
+import contextlib
 import json
 import os
 import sys
 from typing import Dict, List, Optional
 from datetime import datetime
 from modules.questionnaire import DataCollector
-from modules.generator import WordlistGenerator
+from modules.generator import OUTPUT_VERSION, WordlistGenerator
 from modules.output import OutputManager
-from modules.utils import display_banner, validate_length, sanitize_filename
+from modules.dedup import DEFAULT_STREAM_DEDUP, create_deduplicator
+from modules.sorting import create_sorter
+from modules.parallel import generate_parallel
+from modules.rules import load_rules
+from modules.planner import GenerationPlanner
+from modules.merge import merge_wordlists
+from modules.batch import generate_batch, load_targets
+from modules.cache import ResultCache, cache_key
+from modules.ranking import generate_ranked, load_model
+from modules.structures import StructureModel
+from modules.instrumentation import profiled
+from modules.partition import save_sharded
+from modules.checkpoint import CHECKPOINT_INTERVAL, Checkpointer, checkpoint_path, load_checkpoint, prepare_resume
+from modules.incremental import drop_existing, fingerprint, load_state, save_state, state_path
+from modules.writers import COMPRESSION_FORMATS, STDOUT, check_compress_level, discard_stdout
+from modules.utils import display_banner, validate_length, sanitize_filename, format_bytes
 
 __version__ = "1.0.0"
 
-@click.command()
+# Warn before in-memory generation is projected to need more than this
+MEMORY_WARNING_BYTES = 2 * 1024 * 1024 * 1024
+
+@click.group(invoke_without_command=True)
 @click.option('--config', '-c', type=click.Path(exists=True), help='Load configuration from JSON file')
-@click.option('--output', '-o', default='wordlist.txt', help='Output filename (default: wordlist.txt)')
-@click.option('--format', '-f', type=click.Choice(['txt', 'csv', 'json']), default='txt', help='Output format')
+@click.option('--output', '-o', default='wordlist.txt', help='Output filename, or - to stream to stdout (default: wordlist.txt)')
+@click.option('--format', '-f', type=click.Choice(['txt', 'csv', 'json', 'jsonl']), default='txt', help='Output format')
 @click.option('--min-length', type=int, default=4, help='Minimum password length (default: 4)')
 @click.option('--max-length', type=int, default=25, help='Maximum password length (default: 25)')
 @click.option('--quiet', '-q', is_flag=True, help='Quiet mode - minimal output')
 @click.option('--verbose', '-v', is_flag=True, help='Verbose mode - detailed output')
 @click.option('--preview', '-p', is_flag=True, help='Preview mode - show sample passwords only')
 @click.option('--batch', is_flag=True, help='Batch mode - no interactive prompts')
+@click.option('--stream', is_flag=True,
+              help='Stream mode - write passwords as they are generated (unsorted), deduplicating with --dedup')
+@click.option('--dedup', type=click.Choice(['memory', 'hash', 'external']), default=None,
+              help='Deduplication backend for stream mode (default: hash; external keeps memory bounded)')
+@click.option('--max-memory', type=int, default=None,
+              help='Memory cap in MB for deduplication and sorting runs (default: unlimited)')
+@click.option('--order', type=click.Choice(['none', 'lex', 'length', 'priority', 'probability']), default=None,
+              help='Output order using bounded-memory external sorting (implies --stream); probability ranks by '
+                   'likelihood (default: lex sorted in memory, or generation order with --stream)')
+@click.option('--no-sort', is_flag=True, help='Keep generation order (same as --order none)')
+@click.option('--workers', '-w', type=click.IntRange(min=1), default=1,
+              help='Generate on N worker processes and merge their sorted shards (default: 1)')
+@click.option('--rules', 'rules_file', type=click.Path(exists=True),
+              help='Apply a hashcat-style rule file to every base word')
+@click.option('--leet-max', type=click.IntRange(min=0), default=None,
+              help='Max leet substitutions per word for partial spellings (default: 1)')
+@click.option('--estimate', is_flag=True, help='Print the per-phase size plan and exit without generating')
+@click.option('--max-candidates', type=int, default=None,
+              help='Refuse to generate when the plan exceeds N candidates')
+@click.option('--fsync', is_flag=True, help='fsync the output file before exiting')
+@click.option('--compress', type=click.Choice(COMPRESSION_FORMATS), default=None,
+              help='Compress output while writing (zst requires the zstandard package)')
+@click.option('--compress-level', type=int, default=None, help='Compression level (default depends on codec)')
+@click.option('--compress-threads', type=click.IntRange(min=1), default=1,
+              help='Compression threads; gz/bz2/xz write independently compressed blocks (default: 1)')
+@click.option('--annotate', is_flag=True, help='Add the generation phase to each jsonl record (stream mode)')
+@click.option('--packed', is_flag=True, help='Hold the in-memory result as one packed UTF-8 buffer (less memory)')
+@click.option('--targets', type=click.Path(exists=True),
+              help='Directory of JSON profiles or a JSONL file; writes one wordlist per target')
+@click.option('--output-dir', default='wordlists', help='Output directory for --targets (default: wordlists)')
+@click.option('--top-k', type=click.IntRange(min=1), default=None,
+              help='Keep only the N most likely candidates (implies --order probability)')
+@click.option('--rank-weights', type=click.Path(exists=True, dir_okay=False), default=None,
+              help='JSON file of phase/shape/length weights for --order probability')
+@click.option('--train', 'train_file', type=click.Path(exists=True, dir_okay=False), default=None,
+              help='Learn shape and length frequencies for --order probability from example passwords')
+@click.option('--structures', 'structures_file', type=click.Path(exists=True, dir_okay=False), default=None,
+              help='Learn password structures from example passwords and fill them with the target\'s words')
+@click.option('--structure-limit', type=click.IntRange(min=1), default=None,
+              help='Most likely structure candidates generated per target (default: 100000)')
+@click.option('--profile', 'profile_path', type=click.Path(dir_okay=False), default=None,
+              help='Run under cProfile, print the top functions and dump the stats to this file')
+@click.option('--shards', type=click.IntRange(min=1), default=None,
+              help='Split the output into N hash-partitioned, deduplicated files plus a manifest')
+@click.option('--shard-size', type=click.IntRange(min=1), default=None,
+              help='Split the output into shards of about N candidates each (instead of --shards)')
+@click.option('--resume', is_flag=True,
+              help='Continue an interrupted streamed txt run from its last checkpoint, appending to its output')
+@click.option('--checkpoint-interval', type=click.FloatRange(min=0), default=CHECKPOINT_INTERVAL,
+              help='Seconds between checkpoints of streamed txt runs; 0 disables them (default: 60)')
+@click.option('--incremental', is_flag=True,
+              help='Append only what new base words add to the existing txt output (uses its saved run state)')
+@click.option('--no-cache', is_flag=True,
+              help='Always regenerate; do not read or write the wordlist cache (sorted runs are cached by default)')
+@click.option('--cache-dir', type=click.Path(file_okay=False), default=None,
+              help='Wordlist cache directory; it holds copies of generated, target-derived wordlists '
+                   '(default: ~/.cache/cyberwordlist)')
+@click.option('--cache-size', type=click.IntRange(min=0), default=1024,
+              help='Wordlist cache size limit in MB; least recently used entries go first (default: 1024)')
 @click.version_option(version=__version__)
-def main(config, output, format, min_length, max_length, quiet, verbose, preview, batch):
+@click.pass_context
+def main(ctx, config, output, format, min_length, max_length, quiet, verbose, preview, batch, stream, dedup, max_memory,
+         order, no_sort, workers, rules_file, leet_max, estimate, max_candidates, fsync,
+         compress, compress_level, compress_threads, annotate, packed, targets, output_dir,
+         top_k, rank_weights, train_file, structures_file, structure_limit, profile_path, shards, shard_size, resume,
+         checkpoint_interval, incremental, no_cache, cache_dir, cache_size):
     """
     CyberWordlist Pro - Advanced Password Dictionary Generator
     
@@ -42,8 +125,39 @@ def main(config, output, format, min_length, max_length, quiet, verbose, preview
         cyberwordlist.py --config target.json     # Batch mode with config
         cyberwordlist.py --preview -v             # Preview with verbose output
         cyberwordlist.py -o custom.txt --format csv --min-length 8
+        cyberwordlist.py --config target.json --stream   # Bounded-memory streaming write
+        cyberwordlist.py -c target.json --dedup external --max-memory 256
+        cyberwordlist.py -c target.json --order length
+        cyberwordlist.py -c target.json --workers 8
+        cyberwordlist.py -c target.json --rules example.rule
+        cyberwordlist.py -c target.json --estimate       # Size the job without generating
+        cyberwordlist.py -c target.json --compress xz --compress-threads 8
+        cyberwordlist.py -c target.json -f jsonl --stream --annotate
+        cyberwordlist.py merge old.txt public.txt -c target.json -o merged.txt
+        cyberwordlist.py --targets staff/ --workers 8 --output-dir lists
+        cyberwordlist.py -c target.json --incremental    # After editing target.json
+        cyberwordlist.py -c target.json --stream --resume   # After an interrupted run
+        cyberwordlist.py -c target.json --shards 8 --workers 4
+        cyberwordlist.py -c target.json --top-k 10000 --train sample.txt
+        cyberwordlist.py -c target.json --structures sample.txt
+        cyberwordlist.py -c target.json -v --profile run.prof
+        cyberwordlist.py -c target.json -o - | john --stdin hashes.txt
     """
     
+    # Subcommands (e.g. merge) handle everything themselves
+    if ctx.invoked_subcommand is not None:
+        return
+    
+    # Rerun everything below under the profiler
+    if profile_path:
+        with profiled(profile_path):
+            return ctx.invoke(main.callback, **dict(ctx.params, profile_path=None))
+    
+    # With -o -, candidates are written to stdout as they are generated
+    pipe_messages(output)
+    if output == STDOUT or resume:
+        stream = True
+    
     # Display banner unless in quiet mode
     if not quiet:
         display_banner(__version__)
@@ -53,14 +167,78 @@ def main(config, output, format, min_length, max_length, quiet, verbose, preview
         click.echo("❌ Error: Minimum length cannot be greater than maximum length", err=True)
         sys.exit(1)
     
+    # Fail on a bad level before any generation work, not once the output is opened
+    check_compress_level(compress, compress_level)
+    
+    if no_sort:
+        order = 'none'
+    
+    if top_k is not None and order not in (None, 'probability'):
+        click.echo("❌ Error: --top-k keeps the most likely candidates and cannot be combined with --order", err=True)
+        sys.exit(1)
+    if top_k is not None or rank_weights or train_file:
+        order = order or 'probability'
+    
+    if shards is not None and shard_size is not None:
+        click.echo("❌ Error: Use either --shards or --shard-size", err=True)
+        sys.exit(1)
+    sharded = shards is not None or shard_size is not None
+    if sharded and (output == STDOUT or incremental or resume or order not in (None, 'lex', 'none')):
+        click.echo("❌ Error: Sharded output is written to files, in lex or generation order "
+                   "(no --incremental or --resume)", err=True)
+        sys.exit(1)
+    
+    # Reject combinations where a mode would silently drop one of the flags
+    if targets and (stream or dedup or order or sharded or incremental):
+        raise click.UsageError("--targets writes one sorted wordlist per target and takes no --stream, --dedup, "
+                               "--order, --shards, --incremental or --resume")
+    if order == 'probability' and (workers > 1 or dedup):
+        raise click.UsageError("--order probability ranks and deduplicates in one process and takes no "
+                               "--workers or --dedup")
+    if workers > 1 and dedup and not sharded:
+        raise click.UsageError("--workers deduplicates while merging its sorted shards and takes no --dedup")
+    if incremental and order not in (None, 'lex'):
+        raise click.UsageError("--incremental appends sorted deltas and takes no --order other than lex")
+    
     # Sanitize output filename
     output = sanitize_filename(output)
     
     try:
         # Initialize components
         collector = DataCollector(quiet=quiet, verbose=verbose)
-        generator = WordlistGenerator(verbose=verbose)
-        output_manager = OutputManager(format=format, verbose=verbose)
+        rules = load_rules(rules_file) if rules_file else None
+        structures = StructureModel.learn(structures_file) if structures_file else None
+        generator = WordlistGenerator(verbose=verbose, rules=rules, structures=structures)
+        output_manager = OutputManager(format=format, verbose=verbose, fsync=fsync, compress=compress,
+                                       compress_level=compress_level, compress_threads=compress_threads,
+                                       annotate=annotate)
+        
+        if rules is not None and verbose:
+            click.echo(f"📜 Loaded {len(rules)} rules from {rules_file}")
+        if structures is not None and verbose:
+            click.echo(f"🧬 Learned {len(structures.templates)} password structures from {structures_file}")
+        
+        # Many targets: one wordlist each, sharing target-independent work
+        if targets:
+            options = {'min_length': min_length, 'max_length': max_length}
+            if leet_max is not None:
+                options['leet_max_substitutions'] = leet_max
+            if structure_limit is not None:
+                options['structure_limit'] = structure_limit
+            
+            target_list = load_targets(targets)
+            if verbose:
+                click.echo(f"📁 Loaded {len(target_list)} target profiles from {targets}")
+            
+            summaries = generate_batch(generator, output_manager, target_list, options,
+                                       output_dir=sanitize_filename(output_dir), workers=workers, packed=packed)
+            
+            if not quiet:
+                for summary in summaries:
+                    click.echo(f"   {summary['name']:<30} {summary['count']:>12,}  {summary['path']}")
+                click.echo(f"✅ Generated {len(summaries)} wordlists "
+                           f"({sum(summary['count'] for summary in summaries):,} passwords in total)")
+            return
         
         # Load data
         if config:
@@ -79,32 +257,306 @@ def main(config, output, format, min_length, max_length, quiet, verbose, preview
             'min_length': min_length,
             'max_length': max_length
         })
+        if leet_max is not None:
+            data['options']['leet_max_substitutions'] = leet_max
+        if structure_limit is not None:
+            data['options']['structure_limit'] = structure_limit
         
-        # Generate wordlist
-        if verbose:
-            click.echo("🔄 Generating wordlist...")
-        
-        result = generator.generate(
+        # Size the job before generating anything
+        plan = GenerationPlanner(generator).plan(
             personal_info=data['personal_info'],
             social_media=data['social_media'],
             recon_info=data['recon_info'],
             options=data['options']
         )
         
+        if estimate or verbose:
+            output_manager.display_plan(plan)
+        if estimate:
+            return
+        
+        # Shards of about --shard-size candidates, by the plan's (pre-deduplication) count
+        if shard_size is not None:
+            shards = max(1, -(-plan['total_candidates'] // shard_size))
+        
+        if max_candidates is not None and plan['total_candidates'] > max_candidates:
+            click.echo(f"❌ Error: Plan exceeds --max-candidates ({plan['total_candidates']:,} > {max_candidates:,})", err=True)
+            sys.exit(1)
+        
+        in_memory = workers == 1 and not (stream or dedup or order or sharded)
+        if in_memory and plan['memory_bytes'] > MEMORY_WARNING_BYTES and not quiet:
+            click.echo(f"⚠️  Projected memory is {format_bytes(plan['memory_bytes'])}; "
+                       f"consider --stream, --dedup hash or --workers", err=True)
+        
+        # Incremental runs extend an existing txt output, using the base words saved with it
+        state = None
+        if incremental and not preview:
+            if format != 'txt' or compress or output == STDOUT:
+                raise click.ClickException("--incremental needs an uncompressed txt output file")
+            output_path = output_manager.output_path(output, '.txt')
+            run_fingerprint = fingerprint(generator, data, rules.sources if rules is not None else None, OUTPUT_VERSION)
+            state = load_state(state_path(output_path))
+            if state is not None and (state['fingerprint'] != run_fingerprint or not os.path.exists(output_path)):
+                if not quiet:
+                    click.echo("⚠️  Options, dates or rules changed since the last run; regenerating in full", err=True)
+                state = None
+        
+        # Streamed txt runs in generation order are checkpointed and can be resumed
+        resumable = (format == 'txt' and not compress and output != STDOUT and workers == 1 and not preview
+                     and state is None and not sharded and (stream or dedup or order) and order in (None, 'none')
+                     and dedup != 'external')
+        checkpoint = None
+        if resumable:
+            output_path = output_manager.output_path(output, '.txt')
+            run_key = cache_key(data, rules.sources if rules is not None else None, OUTPUT_VERSION,
+                                structures.digest() if structures is not None else None)
+        if resume:
+            if not resumable:
+                raise click.ClickException("--resume needs a streamed, uncompressed txt output file in generation "
+                                           "order (no --order, --workers, --incremental or --dedup external)")
+            checkpoint = load_checkpoint(checkpoint_path(output_path))
+            if checkpoint is None:
+                raise click.ClickException(f"No checkpoint found for {output_path}; nothing to resume")
+            if checkpoint['key'] != run_key:
+                raise click.ClickException("The profile, options or rules changed since the checkpoint; cannot resume")
+            if verbose:
+                click.echo(f"⏯️  Resuming from {checkpoint['saved_at']}: {checkpoint['lines']:,} passwords written, "
+                           f"in phase {checkpoint['phase']}")
+        
+        # Sorted, deduplicated runs of an identical profile are served from the cache
+        result_cache = None
+        result = None
+        if (not no_cache and not preview and state is None and not sharded
+                and (in_memory or (workers > 1 and order in (None, 'lex', 'none')))):
+            result_cache = ResultCache(cache_dir, cache_size * 1024 * 1024, verbose=verbose)
+            key = cache_key(data, rules.sources if rules is not None else None, OUTPUT_VERSION,
+                            structures.digest() if structures is not None else None)
+            result = result_cache.load(key, {
+                'generated_at': datetime.now(),
+                'target_profile': data['personal_info'],
+                'options': data['options']
+            })
+        
+        # Generate wordlist
+        if verbose and result is None:
+            click.echo("🔄 Generating wordlist...")
+        
+        if result is not None:
+            pass  # Served from the cache
+        elif state is not None:
+            result = generator.generate_delta(
+                personal_info=data['personal_info'],
+                social_media=data['social_media'],
+                recon_info=data['recon_info'],
+                options=data['options'],
+                previous_words=state['base_words']
+            )
+            result['passwords'] = drop_existing(result['passwords'], output_path)
+        elif preview:
+            # Only generate the handful of candidates that will be shown
+            result = generator.sample(
+                personal_info=data['personal_info'],
+                social_media=data['social_media'],
+                recon_info=data['recon_info'],
+                options=data['options'],
+                limit=20
+            )
+            result['estimated_count'] = plan['total_candidates']
+        elif order == 'probability':
+            result = generate_ranked(
+                generator,
+                personal_info=data['personal_info'],
+                social_media=data['social_media'],
+                recon_info=data['recon_info'],
+                options=data['options'],
+                model=load_model(rank_weights, train_file),
+                top_k=top_k
+            )
+        elif sharded:
+            # Raw candidates in generation order; every shard is deduplicated on its own
+            result = generator.generate_stream(
+                personal_info=data['personal_info'],
+                social_media=data['social_media'],
+                recon_info=data['recon_info'],
+                options=data['options']
+            )
+        elif workers > 1:
+            # Merged shards are already deduplicated and in lexicographic order
+            result = generate_parallel(
+                generator,
+                personal_info=data['personal_info'],
+                social_media=data['social_media'],
+                recon_info=data['recon_info'],
+                options=data['options'],
+                workers=workers,
+                max_memory=max_memory * 1024 * 1024 if max_memory else None,
+                sorter=create_sorter(order, max_memory) if order not in (None, 'lex', 'none') else None
+            )
+        elif stream or dedup or order:
+            order = order or 'none'
+            
+            # External dedup already emits lexicographic order
+            if dedup == 'external' and order == 'lex':
+                order = 'none'
+            
+            # A sort without an explicit backend drops duplicates while merging its runs
+            sorter = create_sorter(order, max_memory, unique=dedup is None)
+            if sorter is None or dedup is not None:
+                deduplicator = create_deduplicator(dedup or DEFAULT_STREAM_DEDUP, max_memory)
+            else:
+                deduplicator = None
+            
+            # Everything the interrupted run wrote counts as already emitted
+            if checkpoint is not None:
+                deduplicator.seed(prepare_resume(output_path, checkpoint))
+            
+            result = generator.generate_stream(
+                personal_info=data['personal_info'],
+                social_media=data['social_media'],
+                recon_info=data['recon_info'],
+                options=data['options'],
+                deduplicator=deduplicator,
+                sorter=sorter,
+                resume=checkpoint
+            )
+            if resumable and checkpoint_interval:
+                output_manager.checkpoint = Checkpointer(checkpoint_path(output_path), run_key, result,
+                                                         checkpoint_interval, resumed=checkpoint)
+        else:
+            result = generator.generate(
+                personal_info=data['personal_info'],
+                social_media=data['social_media'],
+                recon_info=data['recon_info'],
+                options=data['options'],
+                packed=packed
+            )
+        
+        if result_cache is not None and not result.get('cached'):
+            result_cache.store(key, result)
+            if not quiet:
+                click.echo(f"🗄️  Keeping a copy in the wordlist cache ({result_cache.cache_dir}); "
+                           f"--no-cache skips it", err=True)
+        
         # Output results
         if preview:
             output_manager.preview_results(result, limit=20)
-        else:
-            output_manager.save_results(result, output)
+        elif sharded:
+            manifest = save_sharded(result, output_manager, output, shards, workers=workers,
+                                    order=order or 'lex', dedup=dedup, max_memory_mb=max_memory)
             if not quiet:
                 click.echo(f"✅ Wordlist generated successfully!")
+                click.echo(f"📊 Total passwords: {result['count']:,} in {manifest['shards']} shards")
+                click.echo(f"💾 Manifest: {output_manager.last_path}")
+        else:
+            output_manager.save_results(result, output, append=state is not None or checkpoint is not None)
+            if output_manager.checkpoint is not None:
+                output_manager.checkpoint.remove()
+            if checkpoint is not None:
+                result['count'] += checkpoint['lines']
+            if incremental:
+                base_words = generator._extract_base_words(data['personal_info'], data['social_media'],
+                                                           data['recon_info'])
+                save_state(state_path(output_path), base_words, run_fingerprint)
+            
+            if not quiet and state is not None:
+                click.echo(f"✅ Wordlist updated incrementally!")
+                click.echo(f"📊 New passwords: {result['count']:,} from {len(result['added_words']):,} new base words")
+                click.echo(f"💾 Appended to: {output_manager.last_path}")
+            elif not quiet:
+                click.echo(f"✅ Wordlist {'resumed and completed' if checkpoint is not None else 'generated'} successfully!")
                 click.echo(f"📊 Total passwords: {result['count']:,}")
-                click.echo(f"💾 Saved to: {output}")
+                click.echo(f"💾 Saved to: {output_manager.last_path}")
         
         # Display statistics
         if verbose and not preview:
             output_manager.display_statistics(result)
             
+    except BrokenPipeError:
+        # The reader of -o - stopped early (e.g. head); nothing left to do
+        discard_stdout()
+    except KeyboardInterrupt:
+        click.echo("\n\n❌ Operation cancelled by user")
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        if verbose:
+            import traceback
+            traceback.print_exc()
+        sys.exit(1)
+
+@main.command()
+@click.argument('files', nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option('--config', '-c', type=click.Path(exists=True), help='Also generate from this configuration and merge it in')
+@click.option('--output', '-o', default='merged.txt', help='Output filename, or - for stdout (default: merged.txt)')
+@click.option('--format', '-f', type=click.Choice(['txt', 'csv', 'json', 'jsonl']), default='txt', help='Output format')
+@click.option('--min-length', type=int, default=4, help='Minimum password length (default: 4)')
+@click.option('--max-length', type=int, default=25, help='Maximum password length (default: 25)')
+@click.option('--max-memory', type=int, default=None,
+              help='Memory budget in MB for sorting unsorted inputs (default: 256)')
+@click.option('--quiet', '-q', is_flag=True, help='Quiet mode - minimal output')
+@click.option('--verbose', '-v', is_flag=True, help='Verbose mode - detailed output')
+@click.option('--compress', type=click.Choice(COMPRESSION_FORMATS), default=None,
+              help='Compress output while writing (zst requires the zstandard package)')
+@click.option('--compress-level', type=int, default=None, help='Compression level (default depends on codec)')
+@click.option('--compress-threads', type=click.IntRange(min=1), default=1, help='Compression threads (default: 1)')
+@click.option('--fsync', is_flag=True, help='fsync the output file before exiting')
+def merge(files, config, output, format, min_length, max_length, max_memory, quiet, verbose,
+          compress, compress_level, compress_threads, fsync):
+    """
+    Merge existing wordlists (and optionally a fresh generation) into one deduplicated list
+    
+    Input files are memory-mapped and merged as sorted runs, so they are never loaded
+    whole; unsorted inputs are sorted on disk first. The output is in lexicographic order.
+    
+    Examples:
+        cyberwordlist.py merge run1.txt run2.txt -o combined.txt
+        cyberwordlist.py merge previous.txt public.txt -c target.json --min-length 8
+    """
+    if not validate_length(min_length, max_length):
+        click.echo("❌ Error: Minimum length cannot be greater than maximum length", err=True)
+        sys.exit(1)
+    
+    # Fail on a bad level before any generation work, not once the output is opened
+    check_compress_level(compress, compress_level)
+    
+    output = sanitize_filename(output)
+    pipe_messages(output)
+    options = {'min_length': min_length, 'max_length': max_length}
+    
+    try:
+        output_manager = OutputManager(format=format, verbose=verbose, fsync=fsync, compress=compress,
+                                       compress_level=compress_level, compress_threads=compress_threads)
+        
+        generated = None
+        if config:
+            if verbose:
+                click.echo(f"📁 Loading configuration from {config}")
+            data = load_config(config)
+            data['options'].update(options)
+            options = data['options']
+            generated = WordlistGenerator(verbose=verbose).generate_stream(
+                personal_info=data['personal_info'],
+                social_media=data['social_media'],
+                recon_info=data['recon_info'],
+                options=options,
+                sorter=create_sorter('lex', max_memory, unique=True)
+            )
+        
+        result = merge_wordlists(list(files), options, generated=generated,
+                                 max_memory=max_memory * 1024 * 1024 if max_memory else None, verbose=verbose)
+        output_manager.save_results(result, output)
+        
+        if not quiet:
+            click.echo(f"✅ Wordlists merged successfully!")
+            click.echo(f"📊 Total passwords: {result['count']:,}")
+            click.echo(f"💾 Saved to: {output_manager.last_path}")
+        
+        if verbose:
+            output_manager.display_statistics(result)
+            
+    except BrokenPipeError:
+        # The reader of -o - stopped early (e.g. head); nothing left to do
+        discard_stdout()
     except KeyboardInterrupt:
         click.echo("\n\n❌ Operation cancelled by user")
         sys.exit(1)
@@ -115,6 +567,11 @@ def main(config, output, format, min_length, max_length, quiet, verbose, preview
             traceback.print_exc()
         sys.exit(1)
 
+def pipe_messages(output: str) -> None:
+    """With -o -, keep stdout for the wordlist and send every message to stderr"""
+    if output == STDOUT:
+        click.get_current_context().with_resource(contextlib.redirect_stdout(sys.stderr))
+
 def load_config(config_path: str) -> Dict:
     """Load configuration from JSON file"""
     try:
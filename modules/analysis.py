@@ -0,0 +1,114 @@
+"""
+Single-pass character-class analysis of candidate batches
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SPECIAL_CHARS = '!@#$%^&*?~'
+
+# Class flags: bit 0 = contains a digit, bit 1 = contains a special character
+DIGIT_FLAG = 1
+SPECIAL_FLAG = 2
+
+# Category names indexed by the combined class flags
+CATEGORIES = ['alphabetic', 'alphanumeric', 'alpha_special', 'complex']
+
+# Maps digits to 'd' and specials to 's', keeps newlines and deletes every other ASCII
+# character, so a joined batch collapses to one short class string per candidate
+_CLASS_TABLE = {code: None for code in range(128)}
+_CLASS_TABLE.update({ord(c): 'd' for c in '0123456789'})
+_CLASS_TABLE.update({ord(c): 's' for c in SPECIAL_CHARS})
+_CLASS_TABLE[ord('\n')] = '\n'
+
+_SPECIAL_RE = re.compile('[' + re.escape(SPECIAL_CHARS) + ']')
+
+if numpy is not None:
+    _CLASS_LUT = numpy.zeros(256, dtype=numpy.uint8)
+    _CLASS_LUT[[ord(c) for c in '0123456789']] = DIGIT_FLAG
+    _CLASS_LUT[[ord(c) for c in SPECIAL_CHARS]] = SPECIAL_FLAG
+
+class CharClassAnalyzer:
+    """Computes length and class flags for whole batches and keeps running statistics
+    
+    ASCII batches are joined and classified in one pass, either with NumPy over the
+    packed bytes or with a single str.translate; batches containing other characters
+    fall back to str.isdigit per character (so superscripts and other Unicode digits
+    count as digits) and a precompiled regular expression for the specials.
+    """
+    
+    def __init__(self, use_numpy: Optional[bool] = None):
+        self.use_numpy = numpy is not None if use_numpy is None else use_numpy and numpy is not None
+        self.count = 0
+        self.total_length = 0
+        self.min_length = None
+        self.max_length = None
+        self.category_counts = [0] * len(CATEGORIES)
+    
+    def analyze(self, batch: List[str]) -> Tuple[List[int], List[int]]:
+        """Return (lengths, class flags) for a batch and fold it into the statistics"""
+        if not batch:
+            return [], []
+        
+        joined = '\n'.join(batch)
+        if not joined.isascii():
+            lengths, flags = self._analyze_regex(batch)
+        elif self.use_numpy and all(batch):
+            lengths, flags = self._analyze_numpy(joined)
+        else:
+            lengths, flags = self._analyze_translate(batch, joined)
+        
+        self._update(lengths, flags)
+        return lengths, flags
+    
+    def categorize(self, batch: List[str]) -> Iterable[Tuple[str, int, str]]:
+        """(password, length, category) rows for a batch"""
+        lengths, flags = self.analyze(batch)
+        return zip(batch, lengths, [CATEGORIES[flag] for flag in flags])
+    
+    def statistics(self) -> Dict:
+        """Length range, average length and category distribution seen so far"""
+        return {
+            'count': self.count,
+            'min_length': self.min_length,
+            'max_length': self.max_length,
+            'avg_length': self.total_length / self.count if self.count else 0,
+            'categories': dict(zip(CATEGORIES, self.category_counts))
+        }
+    
+    def _analyze_translate(self, batch: List[str], joined: str) -> Tuple[List[int], List[int]]:
+        classes = joined.translate(_CLASS_TABLE).split('\n')
+        flags = [('d' in found) | (('s' in found) << 1) for found in classes]
+        return list(map(len, batch)), flags
+    
+    def _analyze_numpy(self, joined: str) -> Tuple[List[int], List[int]]:
+        data = numpy.frombuffer(joined.encode('ascii'), dtype=numpy.uint8)
+        starts = numpy.concatenate(([0], numpy.flatnonzero(data == 10) + 1))
+        flags = numpy.bitwise_or.reduceat(_CLASS_LUT[data], starts)
+        lengths = numpy.diff(numpy.append(starts, len(data) + 1)) - 1
+        return lengths.tolist(), flags.tolist()
+    
+    def _analyze_regex(self, batch: List[str]) -> Tuple[List[int], List[int]]:
+        flags = [
+            any(map(str.isdigit, password)) | ((_SPECIAL_RE.search(password) is not None) << 1)
+            for password in batch
+        ]
+        return list(map(len, batch)), flags
+    
+    def _update(self, lengths: List[int], flags: List[int]) -> None:
+        self.count += len(lengths)
+        self.total_length += sum(lengths)
+        
+        batch_min = min(lengths)
+        batch_max = max(lengths)
+        self.min_length = batch_min if self.min_length is None else min(self.min_length, batch_min)
+        self.max_length = batch_max if self.max_length is None else max(self.max_length, batch_max)
+        
+        for flag, count in Counter(flags).items():
+            self.category_counts[flag] += count
\ No newline at end of file
@@ -0,0 +1,163 @@
+"""
+Batch generation over many target profiles with a shared generation cache
+"""
+
+import json
+import os
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+import click
+from modules.generator import WordlistGenerator
+from modules.output import OutputManager
+from modules.utils import sanitize_filename
+
+# Word expansions kept per process before the least recently used ones are dropped
+WORD_CACHE_SIZE = 100000
+
+class GenerationCache:
+    """Memoizes the parts of generation that do not depend on a particular target
+    
+    Two kinds of entries are kept, both keyed by the generation options:
+    the static candidates (common passwords, keyboard patterns and brands on their own),
+    and the number/special-character expansions of single words, which repeat across
+    targets that share words such as the company name.
+    """
+    
+    def __init__(self, max_words: int = WORD_CACHE_SIZE):
+        self.max_words = max_words
+        self.static = {}
+        self.words = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def static_candidates(self, generator: WordlistGenerator, options: Dict) -> Tuple[str, ...]:
+        """Candidates generated without any base word"""
+        key = self._options_key(options)
+        if key not in self.static:
+            self.static[key] = tuple(generator._iter_phases({}, [], options, words=[], static=True,
+                                                                structures=False))
+        return self.static[key]
+    
+    def word_affixes(self, generator: WordlistGenerator, word: str, options: Dict) -> Tuple[str, ...]:
+        """The word with every number and special character affix (see WordlistGenerator._word_affixes)"""
+        key = (word, self._options_key(options))
+        affixes = self.words.get(key)
+        if affixes is not None:
+            self.hits += 1
+            self.words.move_to_end(key)
+            return affixes
+        
+        self.misses += 1
+        affixes = self.words[key] = tuple(generator._word_affixes(word, options))
+        if len(self.words) > self.max_words:
+            self.words.popitem(last=False)
+        return affixes
+    
+    def _options_key(self, options: Dict) -> str:
+        return json.dumps(options, sort_keys=True, default=str)
+
+def load_targets(path: str) -> List[Tuple[str, Dict]]:
+    """(name, config) for every profile in a directory of JSON files or a JSONL file"""
+    targets = []
+    
+    try:
+        if os.path.isdir(path):
+            for entry in sorted(os.listdir(path)):
+                if entry.endswith('.json'):
+                    with open(os.path.join(path, entry), 'r', encoding='utf-8') as f:
+                        targets.append((os.path.splitext(entry)[0], json.load(f)))
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, 1):
+                    if line.strip():
+                        config = json.loads(line)
+                        targets.append((config.get('name') or _profile_name(config, line_number), config))
+    except json.JSONDecodeError as e:
+        raise click.ClickException(f"Invalid JSON in target profiles: {e}")
+    except OSError as e:
+        raise click.ClickException(f"Could not load target profiles: {e}")
+    
+    # Every target gets its own output file, even when names collide
+    names = Counter()
+    unique = []
+    for name, config in targets:
+        name = sanitize_filename(name)
+        names[name] += 1
+        unique.append((name if names[name] == 1 else f'{name}-{names[name]}', config))
+    return unique
+
+def _profile_name(config: Dict, line_number: int) -> str:
+    """Output name for a JSONL profile without an explicit 'name'"""
+    personal_info = config.get('personal_info', {})
+    name = '_'.join(part for part in (personal_info.get('first_name'), personal_info.get('last_name')) if part)
+    return name or f'target-{line_number}'
+
+# Per-process state for pool workers, set once by _init_worker
+_worker = {}
+
+def _init_worker(generator: WordlistGenerator, output_manager: OutputManager, packed: bool) -> None:
+    _worker.update(generator=generator, output_manager=output_manager, packed=packed)
+
+def _generate_target(task: Tuple[str, Dict, str]) -> Dict:
+    """Generate and save one target's wordlist"""
+    name, config, path = task
+    generator = _worker['generator']
+    output_manager = _worker['output_manager']
+    
+    result = generator.generate(
+        personal_info=config.get('personal_info', {}),
+        social_media=config.get('social_media', {}),
+        recon_info=config.get('recon_info', {}),
+        options=config['options'],
+        packed=_worker['packed']
+    )
+    output_manager.save_results(result, path)
+    
+    return {
+        'name': name,
+        'path': output_manager.last_path,
+        'count': result['count'],
+        'base_words_count': result['base_words_count']
+    }
+
+def generate_batch(generator: WordlistGenerator, output_manager: OutputManager, targets: List[Tuple[str, Dict]],
+                   options: Dict, output_dir: str, workers: int = 1, packed: bool = False) -> List[Dict]:
+    """Generate one wordlist per target, concurrently when workers > 1
+    
+    Each target's options are overlaid with the command line ones. Static candidates and
+    the expansions of words that appear in more than one target are computed once here
+    and handed to every worker with the generator, instead of being rebuilt per target.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if generator.cache is None:
+        generator.cache = GenerationCache()
+    generator.verbose = False
+    
+    tasks = []
+    word_counts = Counter()
+    for name, config in targets:
+        config = dict(config, options=dict(config.get('options', {}), **options))
+        tasks.append((name, config, os.path.join(output_dir, name)))
+        word_counts.update(set(generator._extract_base_words(
+            config.get('personal_info', {}), config.get('social_media', {}), config.get('recon_info', {})
+        )))
+    
+    # Warm the cache with everything that is shared before it is copied to the workers
+    shared_words = [word for word, count in word_counts.items() if count > 1]
+    for _, config, _ in tasks:
+        generator.cache.static_candidates(generator, config['options'])
+        for word in shared_words:
+            generator.cache.word_affixes(generator, word, config['options'])
+    
+    if output_manager.verbose:
+        click.echo(f"🗂️  {len(tasks)} targets, {len(shared_words)} shared base words, {workers} worker(s)")
+    
+    output_manager.verbose = False
+    _init_worker(generator, output_manager, packed)
+    if workers == 1:
+        return [_generate_target(task) for task in tasks]
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(generator, output_manager, packed)) as executor:
+        return list(executor.map(_generate_target, tasks))
\ No newline at end of file
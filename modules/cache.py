@@ -0,0 +1,169 @@
+"""
+Persistent content-addressed cache of generated wordlists
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import os
+from datetime import datetime
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
+import click
+from modules.writers import ChunkedWriter, open_output
+
+# Default total size of the cache directory before least recently used entries go
+DEFAULT_CACHE_SIZE = 1024 * 1024 * 1024
+
+# Layout of cache entries; bump it when the data or statistics files change
+CACHE_FORMAT_VERSION = 1
+
+# Cached lists are compressed for size, at a level that keeps writing cheap
+CACHE_COMPRESS_LEVEL = 1
+
+def default_cache_dir() -> str:
+    """Per-user cache directory (XDG_CACHE_HOME, falling back to ~/.cache)"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'cyberwordlist')
+
+def cache_key(data: Dict, rules: Optional[List[str]], version: int, structures: Optional[str] = None) -> str:
+    """SHA-256 of the normalized profile, options, rule lines, structure model digest, output and entry versions
+    
+    version is the generator's OUTPUT_VERSION, not the tool version: the output can
+    change between releases without a version bump of the command line tool.
+    """
+    material = {
+        'personal_info': data.get('personal_info', {}),
+        'social_media': data.get('social_media', {}),
+        'recon_info': data.get('recon_info', {}),
+        'options': data.get('options', {}),
+        'rules': rules or [],
+        'structures': structures,
+        'version': version,
+        'format': CACHE_FORMAT_VERSION
+    }
+    encoded = json.dumps(material, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+class ResultCache:
+    """Stores sorted, deduplicated wordlists by cache key and serves them back as streams
+    
+    Each entry is a gzip-compressed list plus a small JSON file of statistics, written
+    next to each other under a two-character fan-out directory. Entries are written to a
+    temporary name while the output is being saved and only become visible once the whole
+    list went through. The statistics file's modification time is the last use; when the
+    directory outgrows max_bytes, the least recently used entries are removed.
+    """
+    
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_CACHE_SIZE, verbose: bool = False):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.verbose = verbose
+    
+    def load(self, key: str, result: Dict) -> Optional[Dict]:
+        """Fill result from a cached entry (passwords as a lazy stream), or None on a miss"""
+        data_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not os.path.exists(data_path):
+            return None
+        
+        # Mark as recently used
+        os.utime(meta_path)
+        
+        result.update(
+            passwords=self._read(data_path),
+            count=meta['count'],
+            base_words_count=meta['base_words_count'],
+            total_before_filter=meta['total_before_filter'],
+            streamed=True,
+            cached=True
+        )
+        if self.verbose:
+            click.echo(f"♻️  Serving cached wordlist {key[:12]} (generated {meta['created_at']})")
+        return result
+    
+    def store(self, key: str, result: Dict) -> None:
+        """Record result['passwords'] into the cache
+        
+        A stream is recorded as the output consumes it; an in-memory list is written
+        straight away and left in place for the savers and statistics.
+        """
+        if result.get('streamed'):
+            result['passwords'] = self._write(key, result['passwords'], result)
+        else:
+            deque(self._write(key, result['passwords'], result), maxlen=0)
+    
+    def _write(self, key: str, passwords: Iterator[str], result: Dict) -> Iterator[str]:
+        data_path, meta_path = self._paths(key)
+        os.makedirs(os.path.dirname(data_path), exist_ok=True)
+        temp_path = f'{data_path}.{os.getpid()}.tmp'
+        completed = False
+        
+        try:
+            with open_output(temp_path, 'gz', CACHE_COMPRESS_LEVEL) as f:
+                writer = ChunkedWriter(f)
+                chunk = []
+                for password in passwords:
+                    chunk.append(password)
+                    if len(chunk) >= writer.chunk_lines:
+                        writer.write_chunk(chunk)
+                        chunk = []
+                    yield password
+                if chunk:
+                    writer.write_chunk(chunk)
+            
+            os.replace(temp_path, data_path)
+            meta = {
+                'count': writer.lines,
+                'base_words_count': result.get('base_words_count', 0),
+                'total_before_filter': result.get('total_before_filter', 0),
+                'created_at': datetime.now().isoformat()
+            }
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            completed = True
+        finally:
+            if not completed and os.path.exists(temp_path):
+                os.remove(temp_path)
+        
+        self._evict()
+    
+    def _read(self, path: str) -> Iterator[str]:
+        with io.TextIOWrapper(gzip.open(path, 'rb'), encoding='utf-8') as f:
+            for line in f:
+                yield line[:-1]
+    
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits max_bytes"""
+        entries = []
+        total = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith('.json'):
+                    meta_path = os.path.join(root, name)
+                    data_path = meta_path[:-len('.json')] + '.txt.gz'
+                    try:
+                        size = os.path.getsize(meta_path) + os.path.getsize(data_path)
+                        entries.append((os.path.getmtime(meta_path), size, meta_path, data_path))
+                    except OSError:
+                        continue
+                    total += size
+        
+        for _, size, meta_path, data_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            for path in (meta_path, data_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+    
+    def _paths(self, key: str) -> Tuple[str, str]:
+        directory = os.path.join(self.cache_dir, key[:2])
+        return os.path.join(directory, key + '.txt.gz'), os.path.join(directory, key + '.json')
\ No newline at end of file
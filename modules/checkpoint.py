@@ -0,0 +1,88 @@
+"""
+Periodic checkpoints of streamed runs and resuming them
+"""
+
+import json
+import os
+import time
+from typing import Dict, Optional
+import click
+from modules.merge import MappedWordlist
+from modules.writers import ChunkedWriter
+
+# The checkpoint of wordlist.txt is kept in wordlist.txt.checkpoint.json
+CHECKPOINT_SUFFIX = '.checkpoint.json'
+
+# Default seconds between checkpoints
+CHECKPOINT_INTERVAL = 60
+
+def checkpoint_path(output_path: str) -> str:
+    """Path of the checkpoint stored next to an output file"""
+    return output_path + CHECKPOINT_SUFFIX
+
+def load_checkpoint(path: str) -> Optional[Dict]:
+    """The saved checkpoint, or None when there is none (or it cannot be read)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+class Checkpointer:
+    """Records how far a streamed txt run got (phase and position in it), at chunk boundaries of the output"""
+    
+    def __init__(self, path: str, key: str, stats: Dict, interval: float = CHECKPOINT_INTERVAL,
+                 resumed: Optional[Dict] = None):
+        self.path = path
+        self.key = key
+        self.stats = stats
+        self.interval = interval
+        # Output lines and bytes that were already there when this run started appending
+        self.base_lines = resumed['lines'] if resumed else 0
+        self.base_offset = resumed['output_offset'] if resumed else 0
+        self.last_saved = time.monotonic()
+    
+    def after_chunk(self, writer: ChunkedWriter) -> None:
+        """ChunkedWriter callback: save a checkpoint once the interval has passed"""
+        if time.monotonic() - self.last_saved >= self.interval:
+            self.save(writer)
+    
+    def save(self, writer: ChunkedWriter) -> None:
+        # Right after a flushed chunk the output holds exactly what the generator yielded,
+        # so output_offset is where a resumed run cuts it back to
+        writer.f.flush()
+        os.fsync(writer.f.fileno())
+        
+        checkpoint = {
+            'key': self.key,
+            'phase': self.stats['phase'],
+            'phase_position': self.stats['total_before_filter'] - self.stats['phase_start'],
+            'count': self.stats['count'],
+            'total_before_filter': self.stats['total_before_filter'],
+            'lines': self.base_lines + writer.lines,
+            'output_offset': self.base_offset + writer.bytes,
+            'saved_at': time.strftime('%Y-%m-%dT%H:%M:%S')
+        }
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f)
+        os.replace(temp_path, self.path)
+        self.last_saved = time.monotonic()
+    
+    def remove(self) -> None:
+        """Drop the checkpoint once the run has completed"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+def prepare_resume(output_path: str, checkpoint: Dict) -> MappedWordlist:
+    """Cut the output back to the checkpointed offset (the rest is generated again) and return its lines"""
+    try:
+        size = os.path.getsize(output_path)
+    except OSError as e:
+        raise click.ClickException(f"Cannot resume, output is missing: {e}")
+    
+    if size < checkpoint['output_offset']:
+        raise click.ClickException(f"Cannot resume, {output_path} is shorter than its checkpoint")
+    if size > checkpoint['output_offset']:
+        os.truncate(output_path, checkpoint['output_offset'])
+    return MappedWordlist(output_path)
\ No newline at end of file
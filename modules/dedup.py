@@ -0,0 +1,192 @@
+"""
+Deduplication backends for streamed candidates
+"""
+
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, Optional
+import click
+from modules.sorting import ExternalSorter
+
+MASK64 = 0xFFFFFFFFFFFFFFFF
+
+# Python set slot (hash + key pointer) on top of the string object itself
+SET_SLOT_OVERHEAD = 16
+
+# Backend of streamed runs without --dedup: 8 bytes per slot instead of every string
+DEFAULT_STREAM_DEDUP = 'hash'
+
+class Deduplicator:
+    """Base deduplication stage sitting between generation and output"""
+    
+    backend = 'none'
+    
+    def __init__(self, max_memory: Optional[int] = None):
+        self.max_memory = max_memory
+        self.seen = 0
+        self.duplicates = 0
+    
+    def filter(self, candidates: Iterable[str]) -> Iterator[str]:
+        """Yield each distinct candidate once"""
+        for candidate in candidates:
+            self.seen += 1
+            if self._add(candidate):
+                yield candidate
+            else:
+                self.duplicates += 1
+    
+    def seed(self, candidates: Iterable[str]) -> None:
+        """Mark candidates as already emitted (the output of an interrupted run)"""
+        for candidate in candidates:
+            self._add(candidate)
+    
+    def memory_usage(self) -> int:
+        """Approximate number of bytes held by the backend"""
+        return 0
+    
+    def statistics(self) -> Dict:
+        """Summary of the deduplication pass"""
+        return {
+            'backend': self.backend,
+            'seen': self.seen,
+            'unique': self.seen - self.duplicates,
+            'duplicates': self.duplicates,
+            'memory_bytes': self.memory_usage()
+        }
+    
+    def _add(self, candidate: str) -> bool:
+        """Record a candidate, returning False if it was already seen"""
+        return True
+    
+    def _check_memory(self, needed: int) -> None:
+        """Abort when the backend would grow past the configured cap"""
+        if self.max_memory and needed > self.max_memory:
+            raise click.ClickException(
+                f"Deduplication ({self.backend}) needs more than {self.max_memory // (1024 * 1024)} MB; "
+                f"raise --max-memory or use --dedup external"
+            )
+
+class MemoryDeduplicator(Deduplicator):
+    """Exact deduplication with an in-memory set of strings"""
+    
+    backend = 'memory'
+    
+    def __init__(self, max_memory: Optional[int] = None):
+        super().__init__(max_memory)
+        self._seen = set()
+        self._bytes = 0
+    
+    def memory_usage(self) -> int:
+        return sys.getsizeof(self._seen) + self._bytes
+    
+    def _add(self, candidate: str) -> bool:
+        if candidate in self._seen:
+            return False
+        
+        self._seen.add(candidate)
+        self._bytes += sys.getsizeof(candidate) + SET_SLOT_OVERHEAD
+        self._check_memory(self._bytes)
+        return True
+
+class HashDeduplicator(Deduplicator):
+    """Compact deduplication keeping only 64-bit fingerprints in an open-addressing table
+    
+    Uses 8 bytes per slot instead of a full string per entry. Two distinct candidates
+    sharing a fingerprint are treated as duplicates, which is vanishingly rare at 64 bits.
+    """
+    
+    backend = 'hash'
+    
+    def __init__(self, max_memory: Optional[int] = None, capacity: int = 1 << 16):
+        super().__init__(max_memory)
+        self._table = array('Q', bytes(8 * capacity))
+        self._mask = capacity - 1
+        self._size = 0
+    
+    def memory_usage(self) -> int:
+        return self._table.itemsize * len(self._table)
+    
+    def _add(self, candidate: str) -> bool:
+        # Zero marks an empty slot, so fold it onto another fingerprint
+        fingerprint = hash(candidate) & MASK64 or 1
+        table = self._table
+        mask = self._mask
+        index = fingerprint & mask
+        
+        while True:
+            slot = table[index]
+            if slot == 0:
+                break
+            if slot == fingerprint:
+                return False
+            index = (index + 1) & mask
+        
+        table[index] = fingerprint
+        self._size += 1
+        
+        # Keep the load factor under 0.7 so probe chains stay short
+        if self._size * 10 > len(table) * 7:
+            self._grow()
+        
+        return True
+    
+    def _grow(self) -> None:
+        """Double the table and reinsert every fingerprint"""
+        capacity = len(self._table) * 2
+        self._check_memory(8 * capacity)
+        
+        old_table = self._table
+        table = array('Q', bytes(8 * capacity))
+        mask = capacity - 1
+        
+        for fingerprint in old_table:
+            if fingerprint:
+                index = fingerprint & mask
+                while table[index]:
+                    index = (index + 1) & mask
+                table[index] = fingerprint
+        
+        self._table = table
+        self._mask = mask
+
+class ExternalDeduplicator(Deduplicator):
+    """Exact deduplication by external sort: sorted runs are spilled to disk and merged
+    
+    Memory stays bounded by max_memory, but nothing is emitted until the input is
+    exhausted and the output comes out in lexicographic order.
+    """
+    
+    backend = 'external'
+    
+    def __init__(self, max_memory: Optional[int] = None, temp_dir: Optional[str] = None):
+        super().__init__(max_memory)
+        self._sorter = ExternalSorter(max_memory=max_memory, unique=True, temp_dir=temp_dir)
+    
+    def filter(self, candidates: Iterable[str]) -> Iterator[str]:
+        for candidate in self._sorter.sort(candidates):
+            yield candidate
+        
+        self.seen = self._sorter.items_in
+        self.duplicates = self._sorter.items_in - self._sorter.items_out
+    
+    def memory_usage(self) -> int:
+        return self._sorter.memory_usage()
+    
+    def statistics(self) -> Dict:
+        stats = super().statistics()
+        stats['runs_spilled'] = self._sorter.runs_spilled
+        return stats
+
+DEDUP_BACKENDS = {
+    'memory': MemoryDeduplicator,
+    'hash': HashDeduplicator,
+    'external': ExternalDeduplicator
+}
+
+def create_deduplicator(backend: str = 'memory', max_memory_mb: Optional[int] = None) -> Deduplicator:
+    """Build a deduplication backend by name with an optional memory cap in MB"""
+    if backend not in DEDUP_BACKENDS:
+        raise click.ClickException(f"Unknown deduplication backend: {backend}")
+    
+    max_memory = max_memory_mb * 1024 * 1024 if max_memory_mb else None
+    return DEDUP_BACKENDS[backend](max_memory=max_memory)
\ No newline at end of file
@@ -2,16 +2,71 @@
 Advanced wordlist generation engine
 """
 
+import itertools
+import random
 import re
-from typing import Dict, List, Set
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 import click
+from modules.dedup import Deduplicator, ExternalDeduplicator
+from modules.sorting import ExternalSorter
+from modules.rules import RuleSet
+from modules.store import PackedWordlist
+from modules.instrumentation import Hook, PhaseRecorder
+
+# Version of the generated candidates and their order, keyed into cached lists, checkpoints
+# and incremental states; bump it with every change to either so older ones are not reused
+OUTPUT_VERSION = 2
+
+# Preview sampling: base words drawn per preview, and candidates scanned per phase
+SAMPLE_WORDS = 4
+SAMPLE_SCAN_LIMIT = 5000
+
+class LengthIndex:
+    """A word table with precomputed length buckets
+    
+    fitting() returns the entries whose length lies in a range, in table order, so a
+    phase can skip every affix or partner word that would take a candidate outside
+    the configured length range without building it. Results are cached per range.
+    """
+    
+    def __init__(self, items: List[str]):
+        self.items = list(items)
+        lengths = [len(item) for item in self.items]
+        self.min_length = min(lengths, default=0)
+        self.max_length = max(lengths, default=0)
+        self._fitting = {}
+    
+    def fitting(self, low: int, high: int) -> List[str]:
+        """Entries with low <= len(entry) <= high"""
+        # Clamp to the lengths present so equivalent ranges share a cache entry
+        low = max(low, self.min_length)
+        high = min(high, self.max_length)
+        if low > high:
+            return []
+        if low == self.min_length and high == self.max_length:
+            return self.items
+        
+        key = (low, high)
+        if key not in self._fitting:
+            self._fitting[key] = [item for item in self.items if low <= len(item) <= high]
+        return self._fitting[key]
 
 class WordlistGenerator:
     """Advanced password wordlist generator"""
     
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, rules: Optional[RuleSet] = None, cache=None, structures=None):
         self.verbose = verbose
+        self.rules = rules
+        
+        # Optional learned template model (see modules.structures.StructureModel)
+        self.structures = structures
+        
+        # Optional memo of target-independent candidates (see modules.batch.GenerationCache)
+        self.cache = cache
+        
+        # Instrumentation callbacks, see add_hook
+        self.hooks: List[Hook] = []
         
         # Base data
         self.common_passwords = [
@@ -33,40 +88,48 @@ class WordlistGenerator:
         self.leet_map = {
             'a': '4', 'e': '3', 'i': '1', 'o': '0', 's': '5', 't': '7', 'l': '1', 'g': '9', 'z': '2'
         }
+        
+        # All substitutions tried when enumerating partial leet spellings (leet_map choice first)
+        self.leet_alternatives = {
+            'a': ['4', '@'], 'e': ['3'], 'i': ['1', '!'], 'o': ['0'], 's': ['5', '$'],
+            't': ['7'], 'l': ['1'], 'g': ['9'], 'z': ['2']
+        }
+        
+        # Affix tables bucketed by length, for length-range pruning in the phases
+        self.length_index = {
+            'numbers': LengthIndex(self.numbers),
+            'top_numbers': LengthIndex(self.numbers[:5]),
+            'special_chars': LengthIndex(self.special_chars),
+            'years': LengthIndex(self.years)
+        }
     
-    def generate(self, personal_info: Dict, social_media: Dict, recon_info: Dict, options: Dict) -> Dict:
-        """Generate comprehensive wordlist based on target intelligence"""
+    def add_hook(self, hook: Hook) -> None:
+        """Call hook(event, info) on 'phase_start', 'phase_end' and 'generation_end' (see PhaseRecorder)"""
+        self.hooks.append(hook)
+    
+    def generate(self, personal_info: Dict, social_media: Dict, recon_info: Dict, options: Dict,
+                 packed: bool = False) -> Dict:
+        """Generate comprehensive wordlist based on target intelligence
+        
+        With packed=True the sorted passwords are returned as a PackedWordlist (one UTF-8
+        buffer plus offsets) instead of a list of str, which takes several times less memory.
+        """
         
         if self.verbose:
             click.echo("🔍 Extracting base words...")
         
         base_words = self._extract_base_words(personal_info, social_media, recon_info)
-        passwords = set()
         
         if self.verbose:
             click.echo(f"📝 Found {len(base_words)} base words")
             click.echo("⚙️  Applying generation patterns...")
         
-        # Generation phases
-        self._generate_basic_combinations(base_words, passwords, options)
-        
-        if options.get('include_dates', True):
-            self._generate_date_combinations(personal_info, base_words, passwords, options)
-        
-        if options.get('include_leet_speak', True):
-            self._generate_leet_variations(list(passwords), passwords, options)
-        
-        if options.get('include_reversed', True):
-            self._generate_reversed_words(base_words, passwords, options)
-        
-        if options.get('include_common_passwords', True):
-            self._add_common_password_variations(base_words, passwords, options)
-        
-        if options.get('include_keyboard_patterns', True):
-            self._add_keyboard_patterns(passwords, options)
-        
-        if options.get('include_brand_names', True):
-            self._add_brand_combinations(base_words, passwords, options)
+        recorder = PhaseRecorder(self.hooks)
+        passwords = set()
+        if self.cache is not None:
+            recorder.collect('cached', self.cache.static_candidates(self, options), passwords)
+        for phase, stream in self._phase_streams(personal_info, base_words, options, static=self.cache is None):
+            recorder.collect(phase, stream, passwords)
         
         # Filter by length
         min_len = options.get('min_length', 4)
@@ -76,23 +139,301 @@ class WordlistGenerator:
             pwd for pwd in passwords 
             if min_len <= len(pwd) <= max_len
         ]
+        total_before_filter = len(passwords)
+        del passwords
         
         if self.verbose:
             click.echo(f"🔧 Filtered to {len(filtered_passwords)} passwords within length range ({min_len}-{max_len})")
         
+        filtered_passwords.sort()
+        if packed:
+            filtered_passwords = PackedWordlist.from_iterable(filtered_passwords, is_sorted=True)
+        
+        result = {
+            'passwords': filtered_passwords,
+            'count': len(filtered_passwords),
+            'generated_at': datetime.now(),
+            'target_profile': personal_info,
+            'options': options,
+            'base_words_count': len(base_words),
+            'total_before_filter': total_before_filter,
+            'phase_stats': recorder.phases
+        }
+        recorder.end({'count': result['count'], 'base_words_count': len(base_words),
+                      'total_before_filter': total_before_filter})
+        return result
+    
+    def generate_delta(self, personal_info: Dict, social_media: Dict, recon_info: Dict, options: Dict,
+                       previous_words: List[str]) -> Dict:
+        """Generate only the candidates a profile change adds to a previous run
+        
+        previous_words are the base words of that run, in their original order. Candidates
+        of words that are still present were produced back then; this covers every phase
+        for the added words, the pairs where an existing word comes first and an added one
+        second, and the common password and brand combinations of words that moved into
+        the limited word slots those phases use. Candidates of removed words are not
+        taken back. The result is sorted but may overlap the previous output.
+        """
+        base_words = self._extract_base_words(personal_info, social_media, recon_info)
+        previous = set(previous_words)
+        current = set(base_words)
+        added = [word for word in base_words if word not in previous]
+        kept = [word for word in base_words if word in previous]
+        
+        if self.verbose:
+            click.echo(f"📝 Found {len(base_words)} base words ({len(added)} new)")
+        
+        passwords = set()
+        if added:
+            # Word-independent candidates were all produced by the previous run
+            passwords.update(self._iter_phases(personal_info, base_words, options, words=added, static=False,
+                                               structures=False))
+            
+            if options.get('include_combinations', True) and len(base_words) > 1:
+                partners = LengthIndex(added)
+                for word in kept:
+                    passwords.update(self._word_pairs(word, partners, options))
+                if options.get('include_leet_speak', True):
+                    passwords.update(self._leet_pairs(kept, added, options))
+        
+        if options.get('include_common_passwords', True):
+            promoted = [word for word in base_words[:5] if word in previous and word not in previous_words[:5]]
+            passwords.update(self._add_common_password_variations(promoted, options, static=False))
+        
+        if options.get('include_brand_names', True):
+            promoted = [word for word in base_words[:3] if word in previous and word not in previous_words[:3]]
+            passwords.update(self._add_brand_combinations(promoted, options, static=False))
+        
+        # Structure candidates are ranked over all words together; the model, dates and options
+        # are part of the run fingerprint, so only a change in the words it can use matters
+        if self.structures is not None and (self.structures.words_by_length(base_words)
+                                            != self.structures.words_by_length(previous_words)):
+            passwords.update(self._generate_structures(personal_info, base_words, options))
+        
+        min_len, max_len = self._length_range(options)
+        filtered_passwords = sorted(pwd for pwd in passwords if min_len <= len(pwd) <= max_len)
+        
         return {
-            'passwords': sorted(filtered_passwords),
+            'passwords': filtered_passwords,
             'count': len(filtered_passwords),
             'generated_at': datetime.now(),
             'target_profile': personal_info,
             'options': options,
             'base_words_count': len(base_words),
-            'total_before_filter': len(passwords)
+            'total_before_filter': len(passwords),
+            'incremental': True,
+            'added_words': added,
+            'removed_words': [word for word in previous_words if word not in current]
+        }
+    
+    def generate_iter(self, personal_info: Dict, social_media: Dict, recon_info: Dict, options: Dict,
+                      stats: Optional[Dict] = None, resume: Optional[Dict] = None) -> Iterator[str]:
+        """Lazily yield length-filtered candidates phase by phase
+        
+        Candidates come out in generation order and are not deduplicated.
+        When a stats dict is given, its counters, the name of the current phase (and where
+        its candidates started in total_before_filter) and the per-phase records (without
+        duplicate counts; phase times include the consumer's time) are updated as the
+        stream advances. resume is a checkpoint (see modules.checkpoint): generation
+        continues after the candidates it records, with its counters.
+        """
+        if stats is None:
+            stats = {}
+        
+        base_words = self._extract_base_words(personal_info, social_media, recon_info)
+        stats['base_words_count'] = len(base_words)
+        stats.setdefault('total_before_filter', 0)
+        stats.setdefault('count', 0)
+        
+        if self.verbose:
+            click.echo(f"📝 Found {len(base_words)} base words")
+        
+        min_len = options.get('min_length', 4)
+        max_len = options.get('max_length', 25)
+        
+        phases = self._phase_streams(personal_info, base_words, options)
+        skip = {}
+        if resume is not None:
+            names = [name for name, _ in phases]
+            if resume['phase'] not in names:
+                raise click.ClickException(f"Checkpoint phase '{resume['phase']}' is not enabled in this run")
+            # Generation order is deterministic: skip finished phases and the candidates already produced
+            phases = phases[names.index(resume['phase']):]
+            skip[resume['phase']] = resume['phase_position']
+            stats['count'] = resume['count']
+            stats['total_before_filter'] = resume['total_before_filter']
+        
+        recorder = PhaseRecorder(self.hooks)
+        stats['phase_stats'] = recorder.phases
+        
+        for phase, stream in phases:
+            stats['phase'] = phase
+            stats['phase_start'] = stats['total_before_filter'] - skip.get(phase, 0)
+            if phase in skip:
+                stream = itertools.islice(stream, skip[phase], None)
+            recorder.start(phase)
+            produced = stats['total_before_filter']
+            for password in stream:
+                stats['total_before_filter'] += 1
+                if min_len <= len(password) <= max_len:
+                    stats['count'] += 1
+                    yield password
+            recorder.finish(stats['total_before_filter'] - produced)
+        
+        recorder.end({'count': stats['count'], 'base_words_count': len(base_words),
+                      'total_before_filter': stats['total_before_filter']})
+    
+    def generate_stream(self, personal_info: Dict, social_media: Dict, recon_info: Dict, options: Dict,
+                        deduplicator: Optional[Deduplicator] = None,
+                        sorter: Optional[ExternalSorter] = None, resume: Optional[Dict] = None) -> Dict:
+        """Build a result whose passwords are produced lazily while they are written
+        
+        When a deduplicator is given, candidates pass through it before reaching the output.
+        A sorter orders the (deduplicated) stream with bounded memory; without one the
+        candidates keep their generation order. resume continues a checkpointed run
+        (see generate_iter).
+        """
+        result = {
+            'passwords': None,
+            'count': 0,
+            'generated_at': datetime.now(),
+            'target_profile': personal_info,
+            'options': options,
+            'base_words_count': 0,
+            'total_before_filter': 0,
+            'streamed': True
+        }
+        passwords = self.generate_iter(personal_info, social_media, recon_info, options, stats=result, resume=resume)
+        
+        if deduplicator is not None:
+            passwords = deduplicator.filter(passwords)
+            result['dedup'] = deduplicator
+        
+        if sorter is not None:
+            passwords = sorter.sort(passwords)
+            result['sort'] = sorter
+        
+        # result['phase'] names each candidate's phase only while candidates flow through one by one
+        result['phase_tracking'] = sorter is None and not isinstance(deduplicator, ExternalDeduplicator)
+        
+        result['passwords'] = passwords
+        return result
+    
+    def sample(self, personal_info: Dict, social_media: Dict, recon_info: Dict, options: Dict,
+               limit: int = 20, seed: Optional[int] = None) -> Dict:
+        """Draw a small representative sample without generating the full wordlist
+        
+        Each phase runs only for a random handful of base words and stops after a bounded
+        number of candidates; a reservoir sample is kept from what it produced.
+        """
+        rng = random.Random(seed)
+        base_words = self._extract_base_words(personal_info, social_media, recon_info)
+        words = rng.sample(base_words, min(len(base_words), SAMPLE_WORDS))
+        
+        min_len = options.get('min_length', 4)
+        max_len = options.get('max_length', 25)
+        
+        phase_samples = []
+        for name, stream in self._phase_streams(personal_info, base_words, options, words=words):
+            candidates = (pwd for pwd in itertools.islice(stream, SAMPLE_SCAN_LIMIT) if min_len <= len(pwd) <= max_len)
+            phase_samples.append((name, self._reservoir_sample(candidates, limit, rng)))
+        
+        # Take from every phase in turn so small phases are represented too
+        samples = []
+        for index in range(limit):
+            for name, reservoir in phase_samples:
+                if index < len(reservoir) and len(samples) < limit:
+                    samples.append((index, reservoir[index], name))
+        
+        phase_order = [name for name, _ in phase_samples]
+        samples = [(password, name) for _, password, name in
+                   sorted(samples, key=lambda item: (phase_order.index(item[2]), item[0]))]
+        
+        return {
+            'passwords': [password for password, _ in samples],
+            'phases': [name for _, name in samples],
+            'count': len(samples),
+            'sampled': True,
+            'generated_at': datetime.now(),
+            'target_profile': personal_info,
+            'options': options,
+            'base_words_count': len(base_words),
+            'total_before_filter': 0
         }
     
+    def _reservoir_sample(self, candidates: Iterator[str], size: int, rng: random.Random) -> List[str]:
+        """Uniform sample of `size` items from a stream of unknown length"""
+        reservoir = []
+        for index, candidate in enumerate(candidates):
+            if index < size:
+                reservoir.append(candidate)
+            else:
+                slot = rng.randint(0, index)
+                if slot < size:
+                    reservoir[slot] = candidate
+        
+        # The first `size` items always enter in stream order; shuffle so any prefix is random too
+        rng.shuffle(reservoir)
+        return reservoir
+    
+    def _iter_phases(self, personal_info: Dict, base_words: List[str], options: Dict,
+                     words: Optional[List[str]] = None, static: bool = True, structures: bool = True) -> Iterator[str]:
+        """Chain all enabled generation phases into one candidate stream
+        
+        words restricts the word-driven patterns to a subset of base_words (one shard of a
+        parallel run); static controls the candidates that do not depend on any base word,
+        and structures the learned structure phase, which uses all base words at once.
+        """
+        for _, stream in self._phase_streams(personal_info, base_words, options, words, static, structures):
+            yield from stream
+    
+    def _phase_streams(self, personal_info: Dict, base_words: List[str], options: Dict,
+                       words: Optional[List[str]] = None, static: bool = True,
+                       structures: bool = True) -> List[Tuple[str, Iterator[str]]]:
+        """Lazy (phase name, candidate iterator) pairs for every enabled phase, in generation order"""
+        if words is None:
+            words = base_words
+        owned = set(words)
+        
+        phases = [('basic', self._generate_basic_combinations(words, base_words, options))]
+        
+        if options.get('include_dates', True):
+            phases.append(('dates', self._generate_date_combinations(personal_info, words, options)))
+        
+        if options.get('include_leet_speak', True):
+            phases.append(('leet', self._generate_leet_variations(personal_info, words, base_words, options)))
+        
+        if options.get('include_reversed', True):
+            phases.append(('reversed', self._generate_reversed_words(words, options)))
+        
+        if options.get('include_common_passwords', True):
+            common_words = [word for word in base_words[:5] if word in owned]  # Limit combinations
+            phases.append(('common', self._add_common_password_variations(common_words, options, static)))
+        
+        if options.get('include_keyboard_patterns', True) and static:
+            phases.append(('keyboard', self._add_keyboard_patterns(options)))
+        
+        if options.get('include_brand_names', True):
+            brand_words = [word for word in base_words[:3] if word in owned]  # Limit combinations
+            phases.append(('brands', self._add_brand_combinations(brand_words, options, static)))
+        
+        if self.rules is not None:
+            phases.append(('rules', self._apply_rules(words, options)))
+        
+        if self.structures is not None and structures:
+            phases.append(('structures', self._generate_structures(personal_info, base_words, options)))
+        
+        return phases
+    
     def _extract_base_words(self, personal_info: Dict, social_media: Dict, recon_info: Dict) -> List[str]:
-        """Extract all possible base words from collected intelligence"""
-        words = set()
+        """Extract all possible base words from collected intelligence
+        
+        Words keep the order they are found in (names first, then keywords, usernames
+        and recon data), so generation order and the limited word slots of the common
+        password and brand phases do not depend on string hashing.
+        """
+        # Insertion-ordered set
+        words = {}
         
         # Personal information
         self._add_if_not_empty(words, personal_info.get('first_name', '').lower())
@@ -148,15 +489,15 @@ class WordlistGenerator:
             self._add_if_not_empty(words, self._capitalize(game))
         
         # Add seasons and colors
-        words.update(self.seasons)
-        words.update(self.colors)
+        words.update(dict.fromkeys(self.seasons))
+        words.update(dict.fromkeys(self.colors))
         
         return [word for word in words if word and len(word) > 0]
     
-    def _add_if_not_empty(self, word_set: Set[str], value: str) -> None:
-        """Add word to set if not empty"""
+    def _add_if_not_empty(self, words: Dict[str, None], value: str) -> None:
+        """Add word to the ordered word set if not empty"""
         if value and value.strip():
-            word_set.add(value.strip())
+            words[value.strip()] = None
     
     def _capitalize(self, text: str) -> str:
         """Capitalize first letter"""
@@ -181,30 +522,79 @@ class WordlistGenerator:
         
         return profile
     
-    def _generate_basic_combinations(self, base_words: List[str], passwords: Set[str], options: Dict) -> None:
-        """Generate basic word combinations"""
-        for word in base_words:
-            passwords.add(word)
-            
-            if options.get('include_numbers', True):
-                for num in self.numbers:
-                    passwords.add(word + num)
-                    passwords.add(num + word)
-            
-            if options.get('include_special_chars', True):
-                for char in self.special_chars:
-                    passwords.add(word + char)
-                    passwords.add(char + word)
+    def _generate_basic_combinations(self, words: List[str], base_words: List[str], options: Dict) -> Iterator[str]:
+        """Generate basic word combinations for words, pairing them with every base word
+        
+        Affixes and partner words are picked from length buckets, so combinations that
+        would fall outside the length range are never built.
+        """
+        partners = LengthIndex(base_words)
+        
+        for word in words:
+            if self.cache is not None:
+                yield from self.cache.word_affixes(self, word, options)
+            else:
+                yield from self._word_affixes(word, options)
             
             if options.get('include_combinations', True) and len(base_words) > 1:
-                for other_word in base_words:
-                    if word != other_word:
-                        passwords.add(word + other_word)
-                        passwords.add(word + '_' + other_word)
-                        passwords.add(word + '.' + other_word)
+                yield from self._word_pairs(word, partners, options)
+    
+    def _word_pairs(self, word: str, partners: LengthIndex, options: Dict) -> Iterator[str]:
+        """word + other, word_other and word.other for every other partner word"""
+        min_len, max_len = self._length_range(options)
+        size = len(word)
+        
+        # Partners short enough for word + '_' + other or long enough for word + other
+        for other_word in partners.fitting(min_len - size - 1, max_len - size):
+            if word != other_word:
+                joined = size + len(other_word)
+                if joined >= min_len:
+                    yield word + other_word
+                if joined < max_len:
+                    yield word + '_' + other_word
+                    yield word + '.' + other_word
     
-    def _generate_date_combinations(self, personal_info: Dict, base_words: List[str], passwords: Set[str], options: Dict) -> None:
+    def _word_affixes(self, word: str, options: Dict) -> Iterator[str]:
+        """The word itself plus its number and special character affixes"""
+        min_len, max_len = self._length_range(options)
+        size = len(word)
+        if min_len <= size <= max_len:
+            yield word
+        
+        if options.get('include_numbers', True):
+            for num in self.length_index['numbers'].fitting(min_len - size, max_len - size):
+                yield word + num
+                yield num + word
+        
+        if options.get('include_special_chars', True):
+            for char in self.length_index['special_chars'].fitting(min_len - size, max_len - size):
+                yield word + char
+                yield char + word
+    
+    def _generate_date_combinations(self, personal_info: Dict, base_words: List[str], options: Dict) -> Iterator[str]:
         """Generate date-based combinations"""
+        min_len, max_len = self._length_range(options)
+        date_variations = LengthIndex(self._date_variations(personal_info))
+        
+        for word in base_words:
+            size = len(word)
+            for date_var in date_variations.fitting(min_len - size - 1, max_len - size):
+                joined = size + len(date_var)
+                if joined >= min_len:
+                    yield word + date_var
+                    yield date_var + word
+                if joined < max_len:
+                    yield word + '_' + date_var
+        
+        # Add years separately
+        words = LengthIndex(base_words)
+        for year in self.length_index['years'].items:
+            for word in words.fitting(min_len - len(year), max_len - len(year)):
+                yield word + year
+                yield year + word
+    
+    def _date_variations(self, personal_info: Dict) -> List[str]:
+        """Year, month, day and short forms of every known DDMMYYYY date"""
         dates = [
             personal_info.get('birth_date', ''),
             personal_info.get('partner_birth_date', ''),
@@ -212,71 +602,164 @@ class WordlistGenerator:
         ]
         dates = [date for date in dates if date and len(date) == 8]
         
+        date_variations = []
         for date_str in dates:
             year = date_str[-4:]
             month = date_str[2:4]
             day = date_str[:2]
             short_year = date_str[-2:]
             
-            date_variations = [year, month, day, short_year, month + day, day + month]
-            
-            for word in base_words:
-                for date_var in date_variations:
-                    passwords.add(word + date_var)
-                    passwords.add(date_var + word)
-                    passwords.add(word + '_' + date_var)
+            date_variations.extend([year, month, day, short_year, month + day, day + month])
         
-        # Add years separately
-        for year in self.years:
-            for word in base_words:
-                passwords.add(word + year)
-                passwords.add(year + word)
-    
-    def _generate_leet_variations(self, current_passwords: List[str], passwords: Set[str], options: Dict) -> None:
-        """Generate leet speak variations"""
-        for password in current_passwords:
-            leet_password = self._to_leet_speak(password)
-            if leet_password != password:
-                passwords.add(leet_password)
+        return date_variations
+    
+    def _generate_leet_variations(self, personal_info: Dict, words: List[str], base_words: List[str],
+                                  options: Dict) -> Iterator[str]:
+        """Generate leet speak variations
+        
+        Leet spellings are enumerated per base word and then expanded with the same number,
+        special character and date affixes as the plain words. Pairwise combinations only use
+        the fully substituted spelling of both words, which keeps that part at W² candidates.
+        """
+        leet_table = self._build_leet_table(words, options.get('leet_max_substitutions', 1))
+        variants = [variant for word in words for variant in leet_table[word]]
+        
+        # No partner words: the pairwise part is handled below
+        yield from self._generate_basic_combinations(variants, [], options)
+        
+        if options.get('include_dates', True):
+            yield from self._generate_date_combinations(personal_info, variants, options)
+        
+        if options.get('include_combinations', True) and len(base_words) > 1:
+            yield from self._leet_pairs(words, base_words, options)
+    
+    def _leet_pairs(self, words: List[str], partners: List[str], options: Dict) -> Iterator[str]:
+        """Fully substituted pairs of words and partner words where at least one changes"""
+        # Leet substitutions keep the length, so partners are bucketed by plain length
+        min_len, max_len = self._length_range(options)
+        full_leet = {word: self._to_leet_speak(word) for word in itertools.chain(words, partners)}
+        partner_index = LengthIndex(partners)
+        for word in words:
+            leet_word = full_leet[word]
+            size = len(word)
+            for other_word in partner_index.fitting(min_len - size - 1, max_len - size):
+                leet_other = full_leet[other_word]
+                if word != other_word and (leet_word != word or leet_other != other_word):
+                    joined = size + len(other_word)
+                    if joined >= min_len:
+                        yield leet_word + leet_other
+                    if joined < max_len:
+                        yield leet_word + '_' + leet_other
+                        yield leet_word + '.' + leet_other
+    
+    def _build_leet_table(self, words: List[str], max_substitutions: int) -> Dict[str, List[str]]:
+        """Precompute the leet spellings of each word"""
+        return {word: self._leet_variants(word, max_substitutions) for word in words}
+    
+    def _leet_variants(self, word: str, max_substitutions: int) -> List[str]:
+        """Enumerate leet spellings with up to max_substitutions replaced characters
+        
+        The fully substituted spelling (see _to_leet_speak) is always included.
+        """
+        positions = [
+            (index, self.leet_alternatives[char.lower()])
+            for index, char in enumerate(word)
+            if char.lower() in self.leet_alternatives
+        ]
+        
+        variants = []
+        seen = {word}
+        chars = list(word)
+        
+        for size in range(1, min(max_substitutions, len(positions)) + 1):
+            for subset in itertools.combinations(positions, size):
+                indices = [index for index, _ in subset]
+                for replacements in itertools.product(*(alternatives for _, alternatives in subset)):
+                    candidate = chars.copy()
+                    for index, replacement in zip(indices, replacements):
+                        candidate[index] = replacement
+                    variant = ''.join(candidate)
+                    if variant not in seen:
+                        seen.add(variant)
+                        variants.append(variant)
+        
+        full = self._to_leet_speak(word)
+        if full not in seen:
+            variants.append(full)
+        
+        return variants
     
     def _to_leet_speak(self, text: str) -> str:
         """Convert text to leet speak"""
         return ''.join(self.leet_map.get(char.lower(), char) for char in text)
     
-    def _generate_reversed_words(self, base_words: List[str], passwords: Set[str], options: Dict) -> None:
+    def _generate_reversed_words(self, base_words: List[str], options: Dict) -> Iterator[str]:
         """Generate reversed word variations"""
+        min_len, max_len = self._length_range(options)
         for word in base_words:
             reversed_word = word[::-1]
-            passwords.add(reversed_word)
+            size = len(word)
+            if min_len <= size <= max_len:
+                yield reversed_word
             
             if options.get('include_numbers', True):
-                for num in self.numbers[:5]:  # Limit to prevent explosion
-                    passwords.add(reversed_word + num)
+                # Limited to the first five numbers to prevent explosion
+                for num in self.length_index['top_numbers'].fitting(min_len - size, max_len - size):
+                    yield reversed_word + num
     
-    def _add_common_password_variations(self, base_words: List[str], passwords: Set[str], options: Dict) -> None:
+    def _add_common_password_variations(self, base_words: List[str], options: Dict, static: bool = True) -> Iterator[str]:
         """Add common password variations"""
+        min_len, max_len = self._length_range(options)
+        words = LengthIndex(base_words)
         for common in self.common_passwords:
-            passwords.add(common)
+            size = len(common)
+            if static and min_len <= size <= max_len:
+                yield common
             
-            for word in base_words[:5]:  # Limit combinations
-                passwords.add(common + word)
-                passwords.add(word + common)
-                passwords.add(common + '_' + word)
+            for word in words.fitting(min_len - size - 1, max_len - size):
+                joined = size + len(word)
+                if joined >= min_len:
+                    yield common + word
+                    yield word + common
+                if joined < max_len:
+                    yield common + '_' + word
     
-    def _add_keyboard_patterns(self, passwords: Set[str], options: Dict) -> None:
+    def _add_keyboard_patterns(self, options: Dict) -> Iterator[str]:
         """Add keyboard pattern variations"""
+        min_len, max_len = self._length_range(options)
         for pattern in self.keyboard_patterns:
-            passwords.add(pattern)
+            size = len(pattern)
+            if min_len <= size <= max_len:
+                yield pattern
             
             if options.get('include_numbers', True):
-                for num in self.numbers[:5]:
-                    passwords.add(pattern + num)
+                for num in self.length_index['top_numbers'].fitting(min_len - size, max_len - size):
+                    yield pattern + num
     
-    def _add_brand_combinations(self, base_words: List[str], passwords: Set[str], options: Dict) -> None:
+    def _add_brand_combinations(self, base_words: List[str], options: Dict, static: bool = True) -> Iterator[str]:
         """Add brand name combinations"""
+        min_len, max_len = self._length_range(options)
+        words = LengthIndex(base_words)
         for brand in self.brands:
-            passwords.add(brand)
+            size = len(brand)
+            if static and min_len <= size <= max_len:
+                yield brand
             
-            for word in base_words[:3]:  # Limit combinations
-                passwords.add(brand + word)
-                passwords.add(word + brand)
\ No newline at end of file
+            for word in words.fitting(min_len - size, max_len - size):
+                yield brand + word
+                yield word + brand
+    
+    def _apply_rules(self, base_words: List[str], options: Dict) -> Iterator[str]:
+        """Apply the compiled rule file to every base word"""
+        min_len, max_len = self._length_range(options)
+        return self.rules.apply(base_words, min_len, max_len)
+    
+    def _generate_structures(self, personal_info: Dict, base_words: List[str], options: Dict) -> Iterator[str]:
+        """Fill the learned structure templates with the target's words and dates, most likely first"""
+        min_len, max_len = self._length_range(options)
+        dates = self._date_variations(personal_info) + self.years
+        return self.structures.generate(base_words, dates, min_len, max_len, options.get('structure_limit'))
+    
+    def _length_range(self, options: Dict) -> Tuple[int, int]:
+        """(min_length, max_length) every phase prunes against"""
+        return options.get('min_length', 4), options.get('max_length', 25)
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""
+Saved run state for incremental regeneration
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional
+from modules.generator import WordlistGenerator
+from modules.merge import MappedWordlist
+
+# The state of wordlist.txt is kept in wordlist.txt.state.json
+STATE_SUFFIX = '.state.json'
+
+def state_path(output_path: str) -> str:
+    """Path of the run state stored next to an output file"""
+    return output_path + STATE_SUFFIX
+
+def fingerprint(generator: WordlistGenerator, data: Dict, rules: Optional[List[str]], version: int) -> str:
+    """Hash of everything besides the base words that shapes the output
+    
+    A delta is only valid against a previous run with the same fingerprint: the same
+    options, date variations (the only other profile input the phases read), rules,
+    structure model and generator output version.
+    """
+    material = {
+        'options': data.get('options', {}),
+        'dates': generator._date_variations(data.get('personal_info', {})),
+        'rules': rules or [],
+        'structures': generator.structures.digest() if generator.structures is not None else None,
+        'version': version
+    }
+    encoded = json.dumps(material, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+def load_state(path: str) -> Optional[Dict]:
+    """The saved state, or None when there is none (or it cannot be read)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_state(path: str, base_words: List[str], run_fingerprint: str) -> None:
+    """Record the base words (in generation order) a run was built from"""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump({'fingerprint': run_fingerprint, 'base_words': base_words}, f, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+def drop_existing(passwords: List[str], output_path: str) -> List[str]:
+    """Remove candidates the existing output already contains, keeping their order"""
+    remaining = set(passwords)
+    for block in MappedWordlist(output_path).blocks():
+        remaining.difference_update(block)
+        if not remaining:
+            break
+    return [password for password in passwords if password in remaining]
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""
+Per-phase instrumentation of generation runs and profiling hooks
+"""
+
+import cProfile
+import itertools
+import mmap
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set
+import click
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Hook signature: hook(event, info) with event one of 'phase_start', 'phase_end', 'generation_end'
+Hook = Callable[[str, Dict], None]
+
+def max_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process so far (None where resource is unavailable)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def current_rss_bytes() -> Optional[int]:
+    """Current resident set size of this process (None where /proc is unavailable)"""
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * mmap.PAGESIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+def memory_usage() -> Optional[int]:
+    """Current traced heap size while tracemalloc is tracing, otherwise the current (not peak) RSS"""
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    return current_rss_bytes()
+
+class PhaseRecorder:
+    """Per-phase wall time, produced/new/duplicate counts and memory_usage() delta of one run, reported to hooks"""
+    
+    def __init__(self, hooks: Iterable[Hook] = ()):
+        self.hooks = list(hooks)
+        self.phases: List[Dict] = []
+        self._started = None
+        self._memory = None
+    
+    def start(self, phase: str) -> None:
+        self.emit('phase_start', {'phase': phase})
+        self.phases.append({'phase': phase})
+        self._memory = memory_usage()
+        self._started = time.perf_counter()
+    
+    def finish(self, produced: int, new: Optional[int] = None) -> Dict:
+        seconds = time.perf_counter() - self._started
+        memory = memory_usage()
+        record = self.phases[-1]
+        record.update(
+            seconds=round(seconds, 6),
+            produced=produced,
+            new=new,
+            duplicates=produced - new if new is not None else None,
+            memory_delta=memory - self._memory if memory is not None and self._memory is not None else None
+        )
+        self.emit('phase_end', record)
+        return record
+    
+    def collect(self, phase: str, stream: Iterable[str], seen: Set[str]) -> Dict:
+        """Add one phase's candidates to seen, counting produced and new ones at C speed"""
+        self.start(phase)
+        before = len(seen)
+        counter = itertools.count()
+        seen.update(map(itemgetter(0), zip(stream, counter)))
+        return self.finish(next(counter), len(seen) - before)
+    
+    def end(self, info: Dict) -> None:
+        self.emit('generation_end', dict(info, phases=self.phases))
+    
+    def emit(self, event: str, info: Dict) -> None:
+        for hook in self.hooks:
+            hook(event, info)
+
+@contextmanager
+def profiled(path: Optional[str] = None, limit: int = 25) -> Iterator[cProfile.Profile]:
+    """Run the block under cProfile and tracemalloc, print the top functions and dump the stats to path"""
+    profiler = cProfile.Profile()
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        if not tracing:
+            tracemalloc.stop()
+        if path:
+            profiler.dump_stats(path)
+            click.echo(f"📊 Saved profile to {path}", err=True)
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats('cumulative').print_stats(limit)
\ No newline at end of file
@@ -0,0 +1,153 @@
+"""
+Memory-mapped wordlist reading and sorted-run merging
+"""
+
+import heapq
+import itertools
+import mmap
+import os
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional
+import click
+from modules.sorting import ExternalSorter
+
+# Bytes of a mapped file decoded and split at a time
+READ_BLOCK_SIZE = 4 * 1024 * 1024
+
+class MappedWordlist:
+    """Reads the lines of an existing wordlist through a read-only memory map
+    
+    The mapping is decoded one block at a time, so a large file is never held in Python
+    strings as a whole and its pages can be dropped by the OS once read. Windows line
+    endings are accepted, blank lines are skipped and lines that are not valid UTF-8
+    are dropped and counted.
+    """
+    
+    def __init__(self, path: str, block_size: int = READ_BLOCK_SIZE):
+        self.path = path
+        self.block_size = block_size
+        self.lines = 0
+        self.skipped = 0
+    
+    def __iter__(self) -> Iterator[str]:
+        for block in self.blocks():
+            yield from block
+    
+    def blocks(self) -> Iterator[List[str]]:
+        """Decoded lines, one list per mapped block"""
+        self.lines = 0
+        self.skipped = 0
+        
+        with open(self.path, 'rb') as f:
+            # mmap refuses empty files
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                size = len(mapped)
+                position = 0
+                
+                while position < size:
+                    end = position + self.block_size
+                    if end >= size:
+                        end = size
+                    else:
+                        newline = mapped.find(b'\n', end)
+                        end = size if newline == -1 else newline + 1
+                    
+                    lines = self._decode(mapped[position:end])
+                    self.lines += len(lines)
+                    yield lines
+                    position = end
+    
+    def is_sorted(self) -> bool:
+        """Whether the lines are in lexicographic order (one pass over the mapping)"""
+        previous = ''
+        for block in self.blocks():
+            if not block:
+                continue
+            if block[0] < previous or any(a > b for a, b in zip(block, itertools.islice(block, 1, None))):
+                return False
+            previous = block[-1]
+        return True
+    
+    def _decode(self, block: bytes) -> List[str]:
+        """Split a block into non-empty lines"""
+        try:
+            lines = block.decode('utf-8').split('\n')
+        except UnicodeDecodeError:
+            lines = []
+            for raw in block.split(b'\n'):
+                try:
+                    lines.append(raw.decode('utf-8'))
+                except UnicodeDecodeError:
+                    self.skipped += 1
+        
+        if b'\r' in block:
+            lines = [line.rstrip('\r') for line in lines]
+        return [line for line in lines if line]
+
+def merge_wordlists(paths: List[str], options: Dict, generated: Optional[Dict] = None,
+                    max_memory: Optional[int] = None, verbose: bool = False) -> Dict:
+    """Merge wordlist files (and optionally a generated stream) into one deduplicated result
+    
+    Every input becomes a sorted run: files that are already sorted are streamed straight
+    from their mapping, the rest are fed together through one ExternalSorter. The runs
+    are k-way merged with heapq.merge and adjacent duplicates dropped, so the output is
+    in lexicographic order and memory stays bounded by the sorter budget.
+    """
+    min_len = options.get('min_length', 4)
+    max_len = options.get('max_length', 25)
+    
+    result = {
+        'passwords': None,
+        'count': 0,
+        'generated_at': datetime.now(),
+        'target_profile': generated['target_profile'] if generated else {},
+        'options': options,
+        'base_words_count': 0,
+        'total_before_filter': 0,
+        'streamed': True,
+        'merged_files': paths
+    }
+    
+    wordlists = [MappedWordlist(path) for path in paths]
+    sorted_lists = []
+    unsorted_lists = []
+    for wordlist in wordlists:
+        (sorted_lists if wordlist.is_sorted() else unsorted_lists).append(wordlist)
+    
+    if verbose:
+        click.echo(f"🔗 Merging {len(wordlists)} files ({len(unsorted_lists)} need sorting)")
+    
+    def in_range(passwords: Iterable[str]) -> Iterator[str]:
+        for password in passwords:
+            result['total_before_filter'] += 1
+            if min_len <= len(password) <= max_len:
+                yield password
+    
+    runs = [in_range(wordlist) for wordlist in sorted_lists]
+    if unsorted_lists:
+        sorter = ExternalSorter(max_memory=max_memory, unique=True)
+        runs.append(sorter.sort(in_range(itertools.chain.from_iterable(unsorted_lists))))
+        result['sort'] = sorter
+    
+    if generated is not None:
+        # Generated candidates are already length-filtered, sorted and unique
+        runs.append(generated['passwords'])
+    
+    def merged() -> Iterator[str]:
+        previous = None
+        for password in heapq.merge(*runs):
+            if password != previous:
+                result['count'] += 1
+                yield password
+                previous = password
+        
+        if generated is not None:
+            result['base_words_count'] = generated['base_words_count']
+            result['total_before_filter'] += generated['total_before_filter']
+        result['skipped_lines'] = sum(wordlist.skipped for wordlist in wordlists)
+    
+    result['passwords'] = merged()
+    return result
\ No newline at end of file
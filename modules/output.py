@@ -5,34 +5,80 @@ Output and export management module
 import click
 import json
 import csv
-from typing import Dict, List
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, TextIO
 from datetime import datetime
+import io
 import os
+from modules.utils import format_bytes
+from modules.analysis import CharClassAnalyzer
+from modules.store import PackedWordlist
+from modules.writers import STDOUT, ChunkedWriter, iter_chunks, open_output, fsync_path
+
+# C-accelerated JSON string encoder (the one json.dumps uses with ensure_ascii=False)
+encode_json_string = json.encoder.encode_basestring
 
 class OutputManager:
     """Handles wordlist output and export functionality"""
     
-    def __init__(self, format: str = 'txt', verbose: bool = False):
+    def __init__(self, format: str = 'txt', verbose: bool = False, fsync: bool = False,
+                 compress: Optional[str] = None, compress_level: Optional[int] = None, compress_threads: int = 1,
+                 annotate: bool = False):
         self.format = format
         self.verbose = verbose
+        self.annotate = annotate
+        self.fsync = fsync
+        self.compress = compress
+        self.compress_level = compress_level
+        self.compress_threads = compress_threads
+        self.write_stats = None
+        self.last_path = None
+        self.append = False
+        
+        # Optional modules.checkpoint.Checkpointer for resumable txt output
+        self.checkpoint = None
     
-    def save_results(self, result: Dict, filename: str) -> None:
-        """Save wordlist results to file"""
+    def save_results(self, result: Dict, filename: str, append: bool = False) -> None:
+        """Save wordlist results to file
+        
+        Passwords may be a list or a lazy iterator (see WordlistGenerator.generate_stream);
+        either way they are written as they are consumed and the written count is stored
+        back into result['count']. With append, txt output is added to an existing file.
+        """
         passwords = result['passwords']
+        self.write_stats = None
+        self.append = append
+        
+        if append and self.format != 'txt':
+            raise click.ClickException("Only txt output can be appended to")
         
         if self.format == 'txt':
-            self._save_txt(passwords, filename)
+            written = self._save_txt(passwords, filename)
         elif self.format == 'csv':
-            self._save_csv(passwords, filename, result)
+            written = self._save_csv(passwords, filename, result)
         elif self.format == 'json':
-            self._save_json(result, filename)
+            written = self._save_json(result, filename)
+        elif self.format == 'jsonl':
+            written = self._save_jsonl(passwords, filename, result)
+        
+        result['count'] = written
+        if self.write_stats is not None:
+            result['write_stats'] = self.write_stats
+        
+        if self.fsync and self.last_path != STDOUT:
+            fsync_path(self.last_path)
         
         if self.verbose:
-            click.echo(f"💾 Saved {len(passwords):,} passwords to {filename}")
+            action = 'Appended' if append else 'Saved'
+            click.echo(f"💾 {action} {written:,} passwords to {self.last_path}")
     
     def preview_results(self, result: Dict, limit: int = 20) -> None:
         """Preview wordlist results"""
         passwords = result['passwords']
+        
+        if result.get('sampled'):
+            self._preview_sample(result, limit)
+            return
+        
         total_count = len(passwords)
         
         click.echo(f"\n🔍 {click.style('Wordlist Preview', bold=True, fg='cyan')}")
@@ -47,6 +93,20 @@ class OutputManager:
         
         click.echo(f"\n⚡ Use without --preview to generate full wordlist")
     
+    def _preview_sample(self, result: Dict, limit: int) -> None:
+        """Preview a sampled result (see WordlistGenerator.sample)"""
+        passwords = result['passwords']
+        
+        click.echo(f"\n🔍 {click.style('Wordlist Preview', bold=True, fg='cyan')}")
+        if result.get('estimated_count') is not None:
+            click.echo(f"📊 Estimated total passwords: up to {result['estimated_count']:,} (before deduplication)")
+        click.echo(f"👀 Showing {min(limit, len(passwords))} sampled passwords:\n")
+        
+        for i, (password, phase) in enumerate(zip(passwords[:limit], result['phases']), 1):
+            click.echo(f"   {i:2d}. {password:<30} {click.style(phase, dim=True)}")
+        
+        click.echo(f"\n⚡ Use without --preview to generate full wordlist")
+    
     def display_statistics(self, result: Dict) -> None:
         """Display detailed generation statistics"""
         click.echo(f"\n📈 {click.style('Generation Statistics', bold=True, fg='green')}")
@@ -56,16 +116,77 @@ class OutputManager:
         click.echo(f"   Total combinations generated: {result.get('total_before_filter', 0):,}")
         click.echo(f"   Final passwords (after filtering): {result['count']:,}")
         
-        # Length distribution
+        # Length and category distribution, from the CSV export pass when there was one
+        # (not available for other formats once a streamed result has been consumed)
+        analysis = result.get('analysis')
         passwords = result['passwords']
-        if passwords:
-            lengths = [len(p) for p in passwords]
-            min_len = min(lengths)
-            max_len = max(lengths)
-            avg_len = sum(lengths) / len(lengths)
-            
-            click.echo(f"   Password length range: {min_len} - {max_len}")
-            click.echo(f"   Average password length: {avg_len:.1f}")
+        if analysis is None and isinstance(passwords, (list, PackedWordlist)) and passwords:
+            analyzer = CharClassAnalyzer()
+            for chunk in self._chunks(passwords):
+                analyzer.analyze(chunk)
+            analysis = analyzer.statistics()
+        
+        if analysis and analysis['count']:
+            click.echo(f"   Password length range: {analysis['min_length']} - {analysis['max_length']}")
+            click.echo(f"   Average password length: {analysis['avg_length']:.1f}")
+            categories = ', '.join(f"{name} {count:,}" for name, count in analysis['categories'].items())
+            click.echo(f"   Categories: {categories}")
+        
+        if result.get('workers'):
+            click.echo(f"   Worker processes: {result['workers']}")
+        
+        # Per-phase breakdown (duplicates are only known when the generator deduplicated)
+        if result.get('phase_stats'):
+            click.echo(f"   {'Phase':<12} {'Produced':>12} {'New':>12} {'Duplicates':>12} {'Time':>9} {'Memory':>10}")
+            for phase in result['phase_stats']:
+                if 'seconds' not in phase:
+                    continue
+                new = f"{phase['new']:,}" if phase['new'] is not None else '-'
+                duplicates = f"{phase['duplicates']:,}" if phase['duplicates'] is not None else '-'
+                delta = phase['memory_delta']
+                memory = f"{'-' if delta < 0 else ''}{format_bytes(abs(delta))}" if delta is not None else '-'
+                click.echo(f"   {phase['phase']:<12} {phase['produced']:>12,} {new:>12} {duplicates:>12} "
+                           f"{phase['seconds']:>8.3f}s {memory:>10}")
+        
+        if result.get('ranked'):
+            kept = f"top {result['top_k']:,}" if result.get('top_k') else 'all candidates'
+            click.echo(f"   Output order: probability ({kept})")
+        
+        if result.get('incremental'):
+            click.echo(f"   New base words: {len(result['added_words']):,} "
+                       f"(removed: {len(result['removed_words']):,}, their candidates are kept)")
+        
+        manifest = result.get('shards')
+        if manifest:
+            counts = [shard['count'] for shard in manifest['files']]
+            click.echo(f"   Output shards: {manifest['shards']} ({min(counts):,} to {max(counts):,} passwords each)")
+        
+        if result.get('merged_files'):
+            click.echo(f"   Files merged: {len(result['merged_files'])}")
+            if result.get('skipped_lines'):
+                click.echo(f"   Lines skipped (not UTF-8): {result['skipped_lines']:,}")
+        
+        # Deduplication
+        dedup = result.get('dedup')
+        if dedup is not None:
+            dedup_stats = dedup.statistics()
+            click.echo(f"   Deduplication backend: {dedup_stats['backend']}")
+            click.echo(f"   Duplicates removed: {dedup_stats['duplicates']:,}")
+            click.echo(f"   Deduplication memory: {dedup_stats['memory_bytes'] / (1024 * 1024):.1f} MB")
+        
+        # Ordering
+        sorter = result.get('sort')
+        if sorter is not None:
+            sort_stats = sorter.statistics()
+            click.echo(f"   Output order: {sort_stats['order']} ({sort_stats['runs_spilled']} runs spilled to disk)")
+        
+        # Write throughput
+        write_stats = result.get('write_stats')
+        if write_stats and write_stats['seconds'] > 0:
+            lines_per_second = write_stats['lines'] / write_stats['seconds']
+            mb_per_second = write_stats['bytes'] / write_stats['seconds'] / (1024 * 1024)
+            click.echo(f"   Write throughput: {lines_per_second:,.0f} lines/s, {mb_per_second:.1f} MB/s "
+                       f"({format_bytes(write_stats['bytes'])} in {write_stats['seconds']:.2f}s)")
         
         # Options used
         options = result.get('options', {})
@@ -74,62 +195,163 @@ class OutputManager:
         
         click.echo(f"   Generation completed: {result['generated_at'].strftime('%Y-%m-%d %H:%M:%S')}")
     
-    def _save_txt(self, passwords: List[str], filename: str) -> None:
+    def display_plan(self, plan: Dict) -> None:
+        """Display the per-phase generation plan"""
+        click.echo(f"\n🧮 {click.style('Generation Plan', bold=True, fg='cyan')}")
+        click.echo(f"   Base words: {plan['base_words_count']:,}")
+        click.echo(f"   {'Phase':<10} {'Combinations':>14} {'In range':>14} {'Bytes':>12}")
+        
+        for phase in plan['phases']:
+            click.echo(f"   {phase['phase']:<10} {phase['generated']:>14,} {phase['candidates']:>14,} "
+                       f"{format_bytes(phase['bytes']):>12}")
+        
+        click.echo(f"   {'total':<10} {plan['total_generated']:>14,} {plan['total_candidates']:>14,} "
+                   f"{format_bytes(plan['bytes']):>12}")
+        click.echo(f"   Length range: {plan['min_length']}-{plan['max_length']} (only in-range candidates are built; "
+                   f"counts are before deduplication)")
+        click.echo(f"   Projected size on disk (txt): up to {format_bytes(plan['bytes'])}")
+        click.echo(f"   Projected memory (in-memory generation): up to {format_bytes(plan['memory_bytes'])}")
+    
+    def output_path(self, filename: str, extension: str) -> str:
+        """Final output filename: format extension plus the compression suffix"""
+        if filename == STDOUT:
+            return filename
+        if not filename.endswith(extension):
+            filename += extension
+        if self.compress and not filename.endswith('.' + self.compress):
+            filename += '.' + self.compress
+        return filename
+    
+    def _open_binary(self, filename: str) -> BinaryIO:
+        """Open an output file for bytes, through the configured compressor"""
+        self.last_path = filename
+        return open_output(filename, self.compress, self.compress_level, self.compress_threads, append=self.append)
+    
+    def _open_text(self, filename: str, newline: Optional[str] = None) -> TextIO:
+        """Open an output file for text, through the configured compressor"""
+        return io.TextIOWrapper(self._open_binary(filename), encoding='utf-8', newline=newline)
+    
+    def _save_txt(self, passwords: Iterable[str], filename: str) -> int:
         """Save passwords to text file"""
         # Ensure .txt extension
-        if not filename.endswith('.txt'):
-            filename += '.txt'
+        filename = self.output_path(filename, '.txt')
+        
+        with self._open_binary(filename) as f:
+            writer = ChunkedWriter(f, on_chunk=self.checkpoint.after_chunk if self.checkpoint is not None else None)
+            if isinstance(passwords, PackedWordlist):
+                # Already newline-terminated UTF-8; handed to the file without copying
+                writer.write_raw(passwords.buffer(), lines=len(passwords))
+                count = len(passwords)
+            else:
+                count = writer.write_lines(passwords)
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            for password in passwords:
-                f.write(password + '\n')
+        self.write_stats = writer.statistics()
+        return count
     
-    def _save_csv(self, passwords: List[str], filename: str, result: Dict) -> None:
+    def _save_csv(self, passwords: Iterable[str], filename: str, result: Dict) -> int:
         """Save passwords to CSV file with metadata"""
         # Ensure .csv extension
-        if not filename.endswith('.csv'):
-            filename += '.csv'
+        filename = self.output_path(filename, '.csv')
+        
+        analyzer = CharClassAnalyzer()
         
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
+        with self._open_text(filename, newline='') as f:
             writer = csv.writer(f)
             
             # Header
             writer.writerow(['password', 'length', 'category'])
             
-            # Data
-            for password in passwords:
-                category = self._categorize_password(password)
-                writer.writerow([password, len(password), category])
+            # Data, classified a whole chunk at a time
+            for chunk in self._chunks(passwords):
+                writer.writerows(analyzer.categorize(chunk))
+        
+        result['analysis'] = analyzer.statistics()
+        return analyzer.count
     
-    def _save_json(self, result: Dict, filename: str) -> None:
-        """Save complete results to JSON file"""
+    def _save_json(self, result: Dict, filename: str) -> int:
+        """Save complete results to JSON file
+        
+        The document is written incrementally: metadata first, then the password array in
+        chunks, then the count and statistics, which are only final once the passwords
+        (possibly a lazy stream) have been consumed.
+        """
         # Ensure .json extension
-        if not filename.endswith('.json'):
-            filename += '.json'
-        
-        # Prepare data for JSON serialization
-        json_result = {
-            'passwords': result['passwords'],
-            'count': result['count'],
-            'generated_at': result['generated_at'].isoformat(),
-            'target_profile': result['target_profile'],
-            'options': result['options'],
-            'statistics': {
-                'base_words_count': result.get('base_words_count', 0),
-                'total_before_filter': result.get('total_before_filter', 0)
-            }
-        }
+        filename = self.output_path(filename, '.json')
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(json_result, f, indent=2, ensure_ascii=False)
-    
-    def _categorize_password(self, password: str) -> str:
-        """Categorize password type for CSV output"""
-        if any(c.isdigit() for c in password):
-            if any(c in '!@#$%^&*?~' for c in password):
-                return 'complex'
-            return 'alphanumeric'
-        elif any(c in '!@#$%^&*?~' for c in password):
-            return 'alpha_special'
+        with self._open_binary(filename) as f:
+            writer = ChunkedWriter(f)
+            header = [
+                self._json_field('generated_at', result['generated_at'].isoformat()),
+                self._json_field('target_profile', result['target_profile']),
+                self._json_field('options', result['options'])
+            ]
+            writer.write_raw(('{\n' + ',\n'.join(header) + ',\n  "passwords": [').encode('utf-8'))
+            
+            count = 0
+            for chunk in self._chunks(result['passwords']):
+                body = ',\n'.join(['    ' + encode_json_string(password) for password in chunk])
+                writer.write_raw(((',\n' if count else '\n') + body).encode('utf-8'), lines=len(chunk))
+                count += len(chunk)
+            
+            footer = [
+                self._json_field('count', count),
+                self._json_field('statistics', self._json_statistics(result))
+            ]
+            closing = '\n  ],\n' if count else '],\n'
+            writer.write_raw((closing + ',\n'.join(footer) + '\n}').encode('utf-8'))
+        
+        self.write_stats = writer.statistics()
+        return count
+    
+    def _save_jsonl(self, passwords: Iterable[str], filename: str, result: Dict) -> int:
+        """Save passwords as JSON Lines, one object per candidate
+        
+        With annotations enabled, each object also names the generation phase it came
+        from. That is only possible while candidates reach the writer in generation order,
+        i.e. not after sorting, external deduplication or parallel generation.
+        """
+        # Ensure .jsonl extension
+        filename = self.output_path(filename, '.jsonl')
+        
+        if self.annotate and result.get('phase_tracking'):
+            # result['phase'] is read as each candidate is pulled from the stream
+            lines = (
+                '{"password": ' + encode_json_string(password) + ', "length": ' + str(len(password))
+                + ', "phase": "' + result['phase'] + '"}'
+                for password in passwords
+            )
         else:
-            return 'alphabetic'
\ No newline at end of file
+            if self.annotate:
+                click.echo("⚠️  Phase annotations need an unsorted stream (--stream without --order); skipping them", err=True)
+            lines = (
+                '{"password": ' + encode_json_string(password) + ', "length": ' + str(len(password)) + '}'
+                for password in passwords
+            )
+        
+        with self._open_binary(filename) as f:
+            writer = ChunkedWriter(f)
+            count = writer.write_lines(lines)
+        
+        self.write_stats = writer.statistics()
+        return count
+    
+    def _chunks(self, passwords: Iterable[str]) -> Iterator[List[str]]:
+        """Lists of passwords to format together, decoded in bulk from a packed store"""
+        if isinstance(passwords, PackedWordlist):
+            return passwords.chunks()
+        return iter_chunks(passwords)
+    
+    def _json_field(self, key: str, value) -> str:
+        """One top-level "key": value member, indented like json.dump(indent=2)"""
+        encoded = json.dumps(value, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+        return f'  {encode_json_string(key)}: {encoded}'
+    
+    def _json_statistics(self, result: Dict) -> Dict:
+        """Statistics block of the JSON export"""
+        statistics = {
+            'base_words_count': result.get('base_words_count', 0),
+            'total_before_filter': result.get('total_before_filter', 0)
+        }
+        if result.get('phase_stats'):
+            statistics['phases'] = [phase for phase in result['phase_stats'] if 'seconds' in phase]
+        return statistics
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""
+Multiprocess wordlist generation across base words
+"""
+
+import heapq
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+import click
+from modules.generator import WordlistGenerator
+from modules.sorting import ExternalSorter
+
+# Shards per worker, so one slow shard does not leave the other workers idle
+SHARDS_PER_WORKER = 4
+
+def partition_words(base_words: List[str], shards: int) -> List[List[str]]:
+    """Split base words round-robin into at most `shards` non-empty groups"""
+    shards = max(1, min(shards, len(base_words)))
+    return [base_words[i::shards] for i in range(shards)]
+
+def _generate_shard(task: Tuple) -> Tuple[str, int]:
+    """Worker entry point: generate one shard, sort and dedup it, write it to disk"""
+    generator, personal_info, base_words, words, static, options, path, max_memory = task
+    
+    min_len = options.get('min_length', 4)
+    max_len = options.get('max_length', 25)
+    total = 0
+    
+    def candidates() -> Iterator[str]:
+        nonlocal total
+        for password in generator._iter_phases(personal_info, base_words, options, words=words, static=static,
+                                                 structures=static):
+            total += 1
+            if min_len <= len(password) <= max_len:
+                yield password
+    
+    sorter = ExternalSorter(max_memory=max_memory, unique=True, temp_dir=os.path.dirname(path))
+    with open(path, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
+        f.writelines(password + '\n' for password in sorter.sort(candidates()))
+    
+    return path, total
+
+def generate_parallel(generator: WordlistGenerator, personal_info: Dict, social_media: Dict, recon_info: Dict,
+                      options: Dict, workers: int, max_memory: Optional[int] = None,
+                      sorter: Optional[ExternalSorter] = None) -> Dict:
+    """Generate a wordlist on a process pool and merge the shards deterministically
+    
+    Base words are partitioned across workers; each worker writes a sorted, deduplicated
+    shard and the shards are k-way merged, so the passwords come out in lexicographic
+    order regardless of which worker finished first. A sorter may reorder the merged stream.
+    """
+    result = {
+        'passwords': None,
+        'count': 0,
+        'generated_at': datetime.now(),
+        'target_profile': personal_info,
+        'options': options,
+        'base_words_count': 0,
+        'total_before_filter': 0,
+        'streamed': True,
+        'workers': workers
+    }
+    passwords = _merge_shards(generator, personal_info, social_media, recon_info, options, workers, max_memory, result)
+    
+    if sorter is not None:
+        passwords = sorter.sort(passwords)
+        result['sort'] = sorter
+    
+    result['passwords'] = passwords
+    return result
+
+def _merge_shards(generator: WordlistGenerator, personal_info: Dict, social_media: Dict, recon_info: Dict,
+                  options: Dict, workers: int, max_memory: Optional[int], result: Dict) -> Iterator[str]:
+    """Run the shard workers, then yield the merged, deduplicated candidates"""
+    base_words = generator._extract_base_words(personal_info, social_media, recon_info)
+    result['base_words_count'] = len(base_words)
+    
+    # Each shard gets its slice of the per-worker memory budget for sorting
+    shard_groups = partition_words(base_words, workers * SHARDS_PER_WORKER)
+    shard_memory = max_memory // workers if max_memory else None
+    
+    if generator.verbose:
+        click.echo(f"🧵 Generating {len(shard_groups)} shards across {workers} workers")
+    
+    work_dir = tempfile.mkdtemp(prefix='cyberwordlist-shards-')
+    files = []
+    
+    try:
+        tasks = [
+            (generator, personal_info, base_words, words, False, options,
+             os.path.join(work_dir, f'shard-{index:05d}.txt'), shard_memory)
+            for index, words in enumerate(shard_groups)
+        ]
+        # Word-independent candidates (common passwords, keyboard patterns, brands) go in their own shard,
+        # together with the structure phase, which needs every base word at once
+        tasks.append((generator, personal_info, base_words, [], True, options,
+                      os.path.join(work_dir, 'shard-static.txt'), shard_memory))
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            shards = list(executor.map(_generate_shard, tasks))
+        
+        result['total_before_filter'] = sum(total for _, total in shards)
+        
+        files = [open(path, 'r', encoding='utf-8', buffering=1024 * 1024) for path, _ in shards]
+        streams = [(line[:-1] for line in f) for f in files]
+        
+        previous = None
+        for password in heapq.merge(*streams):
+            if password != previous:
+                result['count'] += 1
+                yield password
+                previous = password
+    finally:
+        for f in files:
+            f.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
\ No newline at end of file
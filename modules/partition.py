@@ -0,0 +1,177 @@
+"""
+Hash-partitioned (sharded) output with a manifest
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import click
+from modules.dedup import DEFAULT_STREAM_DEDUP, create_deduplicator
+from modules.merge import MappedWordlist
+from modules.output import OutputManager
+from modules.sorting import create_sorter
+from modules.writers import ChunkedWriter
+
+# Candidates buffered across all shards before a shard's buffer is appended to its partition
+PARTITION_BUFFER_LINES = 262144
+
+# Smallest per-shard buffer, however many shards there are
+PARTITION_MIN_BUFFER_LINES = 256
+
+# Partition files held open at once; the least recently written is closed beyond this
+PARTITION_OPEN_FILES = 64
+
+# The manifest of wordlist.0000.txt ... is wordlist.manifest.json
+MANIFEST_SUFFIX = '.manifest.json'
+
+# Output extensions dropped from the output name before shard numbers are added
+OUTPUT_EXTENSIONS = ('.txt', '.csv', '.json', '.jsonl')
+
+def shard_index(candidate: str, shards: int) -> int:
+    """Shard of a candidate: CRC-32 of its UTF-8 bytes modulo the shard count (the same on every host)"""
+    return zlib.crc32(candidate.encode('utf-8')) % shards
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+class PartitionFiles:
+    """Appends chunks to partition files through a bounded LRU of open handles"""
+    
+    def __init__(self, paths: List[str], max_open: int = PARTITION_OPEN_FILES):
+        self.paths = paths
+        self.max_open = max_open
+        self._writers = OrderedDict()
+        
+        for path in paths:
+            open(path, 'wb').close()
+    
+    def write_chunk(self, index: int, chunk: List[str]) -> None:
+        writer = self._writers.pop(index, None)
+        if writer is None:
+            if len(self._writers) >= self.max_open:
+                self._writers.popitem(last=False)[1].f.close()
+            writer = ChunkedWriter(open(self.paths[index], 'ab'))
+        self._writers[index] = writer
+        writer.write_chunk(chunk)
+    
+    def close(self) -> None:
+        while self._writers:
+            self._writers.popitem()[1].f.close()
+
+def partition_candidates(passwords: Iterable[str], shards: int, directory: str) -> List[str]:
+    """Spill candidates, duplicates included, into one raw partition file per shard"""
+    paths = [os.path.join(directory, f'partition-{index:05d}.txt') for index in range(shards)]
+    buffer_lines = max(PARTITION_MIN_BUFFER_LINES, PARTITION_BUFFER_LINES // shards)
+    buffers = [[] for _ in range(shards)]
+    
+    files = PartitionFiles(paths)
+    try:
+        for password in passwords:
+            index = shard_index(password, shards)
+            buffer = buffers[index]
+            buffer.append(password)
+            if len(buffer) >= buffer_lines:
+                files.write_chunk(index, buffer)
+                buffer.clear()
+        
+        for index, buffer in enumerate(buffers):
+            if buffer:
+                files.write_chunk(index, buffer)
+    finally:
+        files.close()
+    return paths
+
+def _read_partition(path: str, result: Dict) -> Iterator[str]:
+    """Lines of a partition file, counted into result['total_before_filter'] as they are read"""
+    for block in MappedWordlist(path).blocks():
+        result['total_before_filter'] += len(block)
+        yield from block
+
+def _finish_shard(task: Tuple[int, str, str, OutputManager, Dict, str, Optional[str], Optional[int]]) -> Dict:
+    """Deduplicate one partition, save it as a shard and describe it for the manifest"""
+    index, partition, name, output_manager, result, order, dedup, max_memory_mb = task
+    shard_result = dict(result, total_before_filter=0)
+    
+    # Same stages as a streamed run: external dedup already emits lexicographic order,
+    # and a sort without an explicit backend drops duplicates while merging its runs
+    if dedup == 'external' and order == 'lex':
+        order = 'none'
+    sorter = create_sorter(order, max_memory_mb, unique=dedup is None)
+    passwords = _read_partition(partition, shard_result)
+    if sorter is None or dedup is not None:
+        passwords = create_deduplicator(dedup or DEFAULT_STREAM_DEDUP, max_memory_mb).filter(passwords)
+    if sorter is not None:
+        passwords = sorter.sort(passwords)
+    
+    shard_result['passwords'] = passwords
+    output_manager.save_results(shard_result, name)
+    os.remove(partition)
+    path = output_manager.last_path
+    
+    return {
+        'index': index,
+        'path': os.path.basename(path),
+        'count': shard_result['count'],
+        'candidates': shard_result['total_before_filter'],
+        'bytes': os.path.getsize(path),
+        'sha256': file_sha256(path)
+    }
+
+def save_sharded(result: Dict, output_manager: OutputManager, output: str, shards: int, workers: int = 1,
+                 order: str = 'lex', dedup: Optional[str] = None, max_memory_mb: Optional[int] = None) -> Dict:
+    """Write result['passwords'] as hash-partitioned, deduplicated shards plus a manifest, returning the manifest"""
+    base, extension = os.path.splitext(output)
+    if extension not in OUTPUT_EXTENSIONS:
+        base = output
+    directory = os.path.dirname(os.path.abspath(base))
+    
+    with tempfile.TemporaryDirectory(prefix='.cyberwordlist-partitions-', dir=directory) as work_dir:
+        partitions = partition_candidates(result['passwords'], shards, work_dir)
+        
+        if output_manager.verbose:
+            click.echo(f"🧩 Partitioned {result['total_before_filter']:,} candidates into {shards} shards")
+        
+        # Shards carry the run's metadata; statistics are only final now the stream is consumed
+        metadata = {key: value for key, value in result.items()
+                    if key in ('generated_at', 'target_profile', 'options', 'base_words_count')}
+        quiet_manager = OutputManager(format=output_manager.format, fsync=output_manager.fsync,
+                                      compress=output_manager.compress, compress_level=output_manager.compress_level,
+                                      compress_threads=output_manager.compress_threads,
+                                      annotate=output_manager.annotate)
+        tasks = [(index, partition, f'{base}.{index:04d}', quiet_manager, metadata, order, dedup, max_memory_mb)
+                 for index, partition in enumerate(partitions)]
+        
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                files = list(executor.map(_finish_shard, tasks))
+        else:
+            files = [_finish_shard(task) for task in tasks]
+    
+    manifest = {
+        'generated_at': result['generated_at'].isoformat(),
+        'format': output_manager.format,
+        'compress': output_manager.compress,
+        'order': order,
+        'partitioning': 'crc32(utf-8) % shards',
+        'shards': shards,
+        'count': sum(shard['count'] for shard in files),
+        'bytes': sum(shard['bytes'] for shard in files),
+        'files': files
+    }
+    manifest_path = base + MANIFEST_SUFFIX
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    
+    result['count'] = manifest['count']
+    result['shards'] = manifest
+    output_manager.last_path = manifest_path
+    return manifest
\ No newline at end of file
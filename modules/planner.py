@@ -0,0 +1,182 @@
+"""
+Generation planner: exact candidate counts per phase before generating anything
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, List
+from modules.generator import WordlistGenerator
+
+# Approximate CPython cost of one str object beyond its characters (ASCII, 64-bit)
+STR_OVERHEAD = 49
+
+# Set entry (hash + pointer) at the typical fill level, plus a list slot in the
+# filtered list built by generate()
+SET_ENTRY_BYTES = 32
+LIST_SLOT_BYTES = 8
+
+def length_histogram(items: Iterable[str]) -> Counter:
+    """Count items by length"""
+    return Counter(len(item) for item in items)
+
+def convolve(left: Counter, right: Counter, extra: int = 0, times: int = 1) -> Counter:
+    """Length histogram of every left + right concatenation (plus `extra` separator chars)"""
+    result = Counter()
+    for left_length, left_count in left.items():
+        for right_length, right_count in right.items():
+            result[left_length + right_length + extra] += left_count * right_count * times
+    return result
+
+class GenerationPlanner:
+    """Computes how many candidates each generation phase will produce
+    
+    Every phase of WordlistGenerator only concatenates tables, so its output can be
+    described as a length histogram built from the histograms of those tables. Counts
+    are exact before deduplication, which makes them a tight upper bound on the output.
+    'generated' is the whole combination space of a phase; only the 'candidates' inside
+    the length range are actually built.
+    """
+    
+    def __init__(self, generator: WordlistGenerator):
+        self.generator = generator
+    
+    def plan(self, personal_info: Dict, social_media: Dict, recon_info: Dict, options: Dict) -> Dict:
+        """Build the per-phase plan for a profile and options"""
+        generator = self.generator
+        base_words = generator._extract_base_words(personal_info, social_media, recon_info)
+        min_len = options.get('min_length', 4)
+        max_len = options.get('max_length', 25)
+        
+        phases = []
+        for name, histogram in self._phase_histograms(personal_info, base_words, options):
+            in_range = {length: count for length, count in histogram.items() if min_len <= length <= max_len}
+            phases.append({
+                'phase': name,
+                'generated': sum(histogram.values()),
+                'candidates': sum(in_range.values()),
+                'bytes': sum((length + 1) * count for length, count in in_range.items()),
+                # Out-of-range combinations are pruned by the phases and never stored
+                'memory_bytes': sum((STR_OVERHEAD + length + SET_ENTRY_BYTES + LIST_SLOT_BYTES) * count
+                                    for length, count in in_range.items())
+            })
+        
+        return {
+            'base_words_count': len(base_words),
+            'min_length': min_len,
+            'max_length': max_len,
+            'phases': phases,
+            'total_generated': sum(phase['generated'] for phase in phases),
+            'total_candidates': sum(phase['candidates'] for phase in phases),
+            'bytes': sum(phase['bytes'] for phase in phases),
+            'memory_bytes': sum(phase['memory_bytes'] for phase in phases)
+        }
+    
+    def _phase_histograms(self, personal_info: Dict, base_words: List[str], options: Dict) -> List:
+        """(phase, length histogram) for every enabled phase, mirroring WordlistGenerator._iter_phases"""
+        generator = self.generator
+        words = length_histogram(base_words)
+        limited_numbers = length_histogram(generator.numbers[:5])
+        phases = [('basic', self._basic(base_words, words, options))]
+        
+        if options.get('include_dates', True):
+            phases.append(('dates', self._dates(personal_info, words)))
+        
+        if options.get('include_leet_speak', True):
+            phases.append(('leet', self._leet(personal_info, base_words, words, options)))
+        
+        if options.get('include_reversed', True):
+            reversed_words = Counter(words)
+            if options.get('include_numbers', True):
+                reversed_words += convolve(words, limited_numbers)
+            phases.append(('reversed', reversed_words))
+        
+        if options.get('include_common_passwords', True):
+            common = length_histogram(generator.common_passwords)
+            common_words = length_histogram(base_words[:5])
+            phases.append(('common', common + convolve(common, common_words, times=2)
+                           + convolve(common, common_words, extra=1)))
+        
+        if options.get('include_keyboard_patterns', True):
+            patterns = length_histogram(generator.keyboard_patterns)
+            if options.get('include_numbers', True):
+                patterns += convolve(patterns, limited_numbers)
+            phases.append(('keyboard', patterns))
+        
+        if options.get('include_brand_names', True):
+            brands = length_histogram(generator.brands)
+            phases.append(('brands', brands + convolve(brands, length_histogram(base_words[:3]), times=2)))
+        
+        if generator.rules is not None:
+            phases.append(('rules', self._rules(base_words)))
+        
+        if generator.structures is not None:
+            # Bounded by the structure limit, so counting the actual candidates is cheap
+            phases.append(('structures', length_histogram(generator._generate_structures(personal_info, base_words,
+                                                                                        options))))
+        
+        return phases
+    
+    def _basic(self, base_words: List[str], words: Counter, options: Dict) -> Counter:
+        """Words, number and special character affixes, and pairwise combinations"""
+        histogram = Counter(words)
+        
+        if options.get('include_numbers', True):
+            histogram += convolve(words, length_histogram(self.generator.numbers), times=2)
+        
+        if options.get('include_special_chars', True):
+            histogram += convolve(words, length_histogram(self.generator.special_chars), times=2)
+        
+        if options.get('include_combinations', True) and len(base_words) > 1:
+            histogram += self._pairs(words, length_histogram(word + word for word in base_words))
+        
+        return histogram
+    
+    def _pairs(self, words: Counter, doubled: Counter) -> Counter:
+        """word + other, word_other and word.other over ordered pairs of distinct words"""
+        pairs = convolve(words, words)
+        pairs.subtract(doubled)
+        pairs = +pairs
+        return pairs + convolve(pairs, Counter({0: 1}), extra=1, times=2)
+    
+    def _dates(self, personal_info: Dict, words: Counter) -> Counter:
+        """Date affixes (prefix, suffix and _suffix) plus the fixed year table"""
+        dates = length_histogram(self.generator._date_variations(personal_info))
+        years = length_histogram(self.generator.years)
+        return (convolve(words, dates, times=2) + convolve(words, dates, extra=1)
+                + convolve(words, years, times=2))
+    
+    def _leet(self, personal_info: Dict, base_words: List[str], words: Counter, options: Dict) -> Counter:
+        """Leet spellings expanded like plain words, plus fully substituted pairs"""
+        generator = self.generator
+        leet_table = generator._build_leet_table(base_words, options.get('leet_max_substitutions', 1))
+        variants = length_histogram(variant for word in base_words for variant in leet_table[word])
+        
+        no_pairs = dict(options, include_combinations=False)
+        histogram = self._basic([], variants, no_pairs)
+        
+        if options.get('include_dates', True):
+            histogram += self._dates(personal_info, variants)
+        
+        if options.get('include_combinations', True) and len(base_words) > 1:
+            # Pairs where neither word changes under leet speak are not emitted
+            unchanged = [word for word in base_words if generator._to_leet_speak(word) == word]
+            histogram += self._pairs(words, length_histogram(word + word for word in base_words))
+            histogram.subtract(self._pairs(length_histogram(unchanged),
+                                           length_histogram(word + word for word in unchanged)))
+            histogram = +histogram
+        
+        return histogram
+    
+    def _rules(self, base_words: List[str]) -> Counter:
+        """Rule output lengths computed from each word length, or per word where case changes can alter it"""
+        rules = self.generator.rules
+        histogram = Counter()
+        predictable = [word for word in base_words if rules.predictable and word.isascii()]
+        for length, count in length_histogram(predictable).items():
+            for output_length in rules.output_lengths(length):
+                if output_length > 0:
+                    histogram[output_length] += count
+        
+        for word in base_words:
+            if not (rules.predictable and word.isascii()):
+                histogram.update(length for length in rules.candidate_lengths(word) if length > 0)
+        return histogram
\ No newline at end of file
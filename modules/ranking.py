@@ -0,0 +1,233 @@
+"""
+Probability ranking of candidates and top-K selection
+"""
+
+import heapq
+import json
+import math
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import click
+from modules.generator import WordlistGenerator
+
+# Prior weight of each generation phase: how likely its patterns are to be chosen by people
+DEFAULT_PHASE_WEIGHTS = {
+    'basic': 1.0,
+    'dates': 0.9,
+    'structures': 0.8,
+    'common': 0.6,
+    'keyboard': 0.5,
+    'rules': 0.5,
+    'leet': 0.35,
+    'brands': 0.3,
+    'reversed': 0.15
+}
+
+# Share of human-chosen passwords per structure shape (runs of character classes:
+# U uppercase, L lowercase, D digit, S symbol), used when no training list is given
+DEFAULT_SHAPE_WEIGHTS = {
+    'LD': 0.28,
+    'L': 0.18,
+    'ULD': 0.10,
+    'D': 0.06,
+    'UL': 0.05,
+    'LDS': 0.04,
+    'ULDS': 0.04,
+    'LS': 0.03,
+    'DL': 0.03,
+    'LDL': 0.02,
+    'ULS': 0.02,
+    'LSD': 0.02,
+    'LSL': 0.02,
+    'LUL': 0.01
+}
+
+# Share of passwords by length when no training list is given
+DEFAULT_LENGTH_WEIGHTS = {
+    4: 0.02, 5: 0.03, 6: 0.13, 7: 0.13, 8: 0.21, 9: 0.13, 10: 0.12, 11: 0.06,
+    12: 0.05, 13: 0.03, 14: 0.02, 15: 0.02, 16: 0.02
+}
+
+# Probability mass given to shapes and lengths the tables do not mention
+UNSEEN_WEIGHT = 0.002
+
+# Maps each ASCII character to its class letter
+_CLASS_TABLE = str.maketrans(
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789',
+    'U' * 26 + 'L' * 26 + 'D' * 10
+)
+
+def character_classes(candidate: str) -> str:
+    """One class letter per character (anything but an ASCII letter or digit is a symbol)"""
+    classes = candidate.translate(_CLASS_TABLE)
+    if classes.strip('ULD'):
+        classes = ''.join(char if char in 'ULD' else 'S' for char in classes)
+    return classes
+
+def shape_of(classes: str) -> str:
+    """Collapse runs of the same class: 'ULLLLDDDD' -> 'ULD'"""
+    return ''.join(char for index, char in enumerate(classes) if index == 0 or classes[index - 1] != char)
+
+class ScoringModel:
+    """Log-probability of a candidate from its phase, structure shape and length
+    
+    score = log P(phase) + log P(shape) + log P(length). The shape and length tables are
+    either the built-in defaults or learned from a local list of example passwords;
+    any table can be overridden from a JSON weights file. Scores are memoized by phase
+    and character-class string, so ranking costs one translate and one lookup per candidate.
+    """
+    
+    def __init__(self, phase_weights: Optional[Dict[str, float]] = None,
+                 shape_weights: Optional[Dict[str, float]] = None,
+                 length_weights: Optional[Dict[int, float]] = None):
+        self.phase_weights = self._log_table(phase_weights or DEFAULT_PHASE_WEIGHTS, normalize=False)
+        self.shape_weights = self._log_table(shape_weights or DEFAULT_SHAPE_WEIGHTS)
+        self.length_weights = self._log_table(length_weights or DEFAULT_LENGTH_WEIGHTS)
+        self.unseen = math.log(UNSEEN_WEIGHT)
+        self._scores = {}
+    
+    def score(self, candidate: str, phase: str) -> float:
+        """Log-probability score of a candidate produced by a phase"""
+        classes = character_classes(candidate)
+        key = (phase, classes)
+        score = self._scores.get(key)
+        if score is None:
+            score = self._scores[key] = (
+                self.phase_weights.get(phase, self.unseen)
+                + self.shape_weights.get(shape_of(classes), self.unseen)
+                + self.length_weights.get(len(classes), self.unseen)
+            )
+        return score
+    
+    def _log_table(self, weights: Dict, normalize: bool = True) -> Dict:
+        total = sum(weights.values()) if normalize else 1.0
+        return {key: math.log(weight / total) for key, weight in weights.items() if weight > 0}
+
+def learn_weights(path: str) -> Dict:
+    """Shape and length frequencies of a local file of example passwords"""
+    shapes = Counter()
+    lengths = Counter()
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                password = line.rstrip('\r\n')
+                if password:
+                    shapes[shape_of(character_classes(password))] += 1
+                    lengths[len(password)] += 1
+    except OSError as e:
+        raise click.ClickException(f"Could not load training list: {e}")
+    
+    if not shapes:
+        raise click.ClickException(f"Training list {path} contains no passwords")
+    return {'shape_weights': dict(shapes), 'length_weights': dict(lengths)}
+
+def read_weights(path: str) -> Dict:
+    """Tables from a JSON weights file: {"phases": {...}, "shapes": {...}, "lengths": {...}}, all optional"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            weights = json.load(f)
+    except (OSError, ValueError) as e:
+        raise click.ClickException(f"Could not load ranking weights: {e}")
+    
+    tables = {}
+    if 'phases' in weights:
+        tables['phase_weights'] = weights['phases']
+    if 'shapes' in weights:
+        tables['shape_weights'] = weights['shapes']
+    if 'lengths' in weights:
+        tables['length_weights'] = {int(length): weight for length, weight in weights['lengths'].items()}
+    return tables
+
+def load_model(weights_path: Optional[str] = None, train_path: Optional[str] = None) -> ScoringModel:
+    """Scoring model from the defaults, a training list and a weights file (which wins)"""
+    tables = {}
+    if train_path:
+        tables.update(learn_weights(train_path))
+    if weights_path:
+        tables.update(read_weights(weights_path))
+    return ScoringModel(**tables)
+
+# Byte inversion table: reverses the order of UTF-32-BE encoded strings
+_INVERT = bytes(255 - byte for byte in range(256))
+
+# Sorts after every inverted code point, so a prefix ranks after its extensions
+_KEY_END = b'\xff\xff\xff\xff'
+
+def _descending(candidate: str) -> bytes:
+    """Bytes that order candidates in reverse alphabetical order (candidates never contain NUL)"""
+    return candidate.encode('utf-32-be').translate(_INVERT) + _KEY_END
+
+def rank_candidates(scored: Iterable[Tuple[float, str]], top_k: Optional[int] = None) -> List[str]:
+    """Candidates in descending score order (ties alphabetical), optionally only the best top_k
+    
+    A candidate produced by several phases keeps its best score. With top_k a bounded
+    min-heap of plain (score, reversed key, candidate) tuples keeps memory at O(k): the
+    root is the weakest kept candidate (lowest score, last alphabetically), and a new one
+    only enters when it beats it, so the result equals the first top_k entries of the
+    full ranking. A kept candidate that scores higher again gets a fresh heap entry;
+    members holds each kept candidate's current score, and entries that no longer match
+    it are dropped lazily when they reach the root.
+    """
+    if top_k is None:
+        best = {}
+        for score, candidate in scored:
+            if score > best.get(candidate, -math.inf):
+                best[candidate] = score
+        return sorted(best, key=lambda candidate: (-best[candidate], candidate))
+    
+    heap = []
+    members = {}
+    for score, candidate in scored:
+        kept = members.get(candidate)
+        if kept is not None:
+            # Already kept: only a better score from another phase changes anything
+            if score > kept:
+                members[candidate] = score
+                heapq.heappush(heap, (score, _descending(candidate), candidate))
+                if len(heap) > 2 * top_k:
+                    # Too many outdated entries: rebuild from the current scores
+                    heap = [(kept_score, _descending(kept_candidate), kept_candidate)
+                            for kept_candidate, kept_score in members.items()]
+                    heapq.heapify(heap)
+            continue
+        
+        if len(members) < top_k:
+            members[candidate] = score
+            heapq.heappush(heap, (score, _descending(candidate), candidate))
+            continue
+        
+        # Drop outdated entries so the root is the weakest kept candidate
+        while members.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+        weakest_score, _, weakest = heap[0]
+        if score > weakest_score or (score == weakest_score and candidate < weakest):
+            members[candidate] = score
+            heapq.heapreplace(heap, (score, _descending(candidate), candidate))
+            del members[weakest]
+    
+    return sorted(members, key=lambda candidate: (-members[candidate], candidate))
+
+def generate_ranked(generator: WordlistGenerator, personal_info: Dict, social_media: Dict, recon_info: Dict,
+                    options: Dict, model: ScoringModel, top_k: Optional[int] = None) -> Dict:
+    """Generate a wordlist ordered by descending likelihood, optionally truncated to top_k"""
+    result = {
+        'passwords': None,
+        'count': 0,
+        'generated_at': datetime.now(),
+        'target_profile': personal_info,
+        'options': options,
+        'base_words_count': 0,
+        'total_before_filter': 0,
+        'ranked': True,
+        'top_k': top_k
+    }
+    
+    def scored() -> Iterator[Tuple[float, str]]:
+        for password in generator.generate_iter(personal_info, social_media, recon_info, options, stats=result):
+            yield model.score(password, result['phase']), password
+    
+    passwords = rank_candidates(scored(), top_k)
+    result['passwords'] = passwords
+    result['count'] = len(passwords)
+    return result
\ No newline at end of file
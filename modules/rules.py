@@ -0,0 +1,270 @@
+"""
+Rule-based mutation engine (hashcat/John style subset)
+
+Each non-empty line of a rule file is one rule: a sequence of functions applied
+left to right to a base word, producing one candidate per word and rule.
+    
+    :      do nothing                  l      lowercase
+    u      uppercase                   c      capitalize first letter, lowercase rest
+    C      lowercase first letter, uppercase rest
+    t      toggle case of all letters  TN     toggle case at position N
+    r      reverse                     d      duplicate
+    f      reflect (word + reversed)   [      delete first character
+    ]      delete last character       $X     append character X
+    ^X     prepend character X         sXY    replace every X with Y
+
+Positions are 0-9 then A-Z (10-35). Whitespace between functions is ignored and
+lines starting with '#' are comments. Leet speak is written as substitutions, e.g.
+`sa4 se3 so0`.
+"""
+
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import click
+
+Operation = Tuple[Callable[..., str], tuple]
+
+def _noop(word: str) -> str:
+    return word
+
+def _lower(word: str) -> str:
+    return word.lower()
+
+def _upper(word: str) -> str:
+    return word.upper()
+
+def _capitalize(word: str) -> str:
+    return word[:1].upper() + word[1:].lower()
+
+def _invert_capitalize(word: str) -> str:
+    return word[:1].lower() + word[1:].upper()
+
+def _toggle_all(word: str) -> str:
+    return word.swapcase()
+
+def _toggle_at(word: str, position: int) -> str:
+    if position >= len(word):
+        return word
+    return word[:position] + word[position].swapcase() + word[position + 1:]
+
+def _reverse(word: str) -> str:
+    return word[::-1]
+
+def _duplicate(word: str) -> str:
+    return word + word
+
+def _reflect(word: str) -> str:
+    return word + word[::-1]
+
+def _delete_first(word: str) -> str:
+    return word[1:]
+
+def _delete_last(word: str) -> str:
+    return word[:-1]
+
+def _append(word: str, suffix: str) -> str:
+    return word + suffix
+
+def _prepend(word: str, prefix: str) -> str:
+    return prefix + word
+
+def _translate(word: str, table: Dict[int, str]) -> str:
+    return word.translate(table)
+
+# Functions without arguments
+SIMPLE_FUNCTIONS = {
+    ':': _noop,
+    'l': _lower,
+    'u': _upper,
+    'c': _capitalize,
+    'C': _invert_capitalize,
+    't': _toggle_all,
+    'r': _reverse,
+    'd': _duplicate,
+    'f': _reflect,
+    '[': _delete_first,
+    ']': _delete_last
+}
+
+POSITIONS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+def _output_length(operation: Callable[..., str], args: tuple, length: int) -> int:
+    """Length of a word after one compiled operation, without applying it (exact for ASCII text only)"""
+    if operation is _append or operation is _prepend:
+        return length + len(args[0])
+    if operation is _duplicate or operation is _reflect:
+        return length * 2
+    if operation is _delete_first or operation is _delete_last:
+        return max(length - 1, 0)
+    return length
+
+def _is_ascii_rule(rule: List[Operation]) -> bool:
+    """Whether every character a rule adds is ASCII, so its predicted lengths hold for ASCII words"""
+    for _, args in rule:
+        for arg in args:
+            values = arg.values() if isinstance(arg, dict) else [arg]
+            if any(isinstance(value, str) and not value.isascii() for value in values):
+                return False
+    return True
+
+def _apply_rule(rule: List[Operation], word: str) -> str:
+    for operation, args in rule:
+        word = operation(word, *args)
+    return word
+
+class RuleSet:
+    """A list of compiled rules applied to every base word"""
+    
+    def __init__(self, rules: List[List[Operation]], sources: List[str]):
+        self.rules = rules
+        self.sources = sources
+        # Case changes of non-ASCII characters can change the length ('ß'.upper() == 'SS')
+        self.ascii_rules = [_is_ascii_rule(rule) for rule in rules]
+        self.predictable = all(self.ascii_rules)
+    
+    def __len__(self) -> int:
+        return len(self.rules)
+    
+    def apply(self, words: Iterable[str], min_length: Optional[int] = None,
+              max_length: Optional[int] = None) -> Iterator[str]:
+        """Yield every rule applied to every word
+        
+        With a length range, rules whose output length (see output_lengths) falls outside
+        it are skipped for that word length instead of being applied and filtered. Where
+        that prediction is not exact (non-ASCII text), candidates are filtered instead.
+        """
+        by_length = {}
+        for word in words:
+            rules = self.rules
+            check = False
+            if min_length is not None:
+                check = not (self.predictable and word.isascii())
+                if word.isascii():
+                    rules = by_length.get(len(word))
+                    if rules is None:
+                        rules = by_length[len(word)] = [
+                            rule for rule, length, exact in zip(self.rules, self.output_lengths(len(word)),
+                                                                self.ascii_rules)
+                            if not exact or min_length <= length <= max_length
+                        ]
+            
+            for rule in rules:
+                candidate = word
+                for operation, args in rule:
+                    candidate = operation(candidate, *args)
+                if candidate and not (check and not min_length <= len(candidate) <= max_length):
+                    yield candidate
+    
+    def candidate_lengths(self, word: str) -> List[int]:
+        """Exact candidate length produced by each rule for one word"""
+        if not word.isascii():
+            return [len(_apply_rule(rule, word)) for rule in self.rules]
+        return [length if exact else len(_apply_rule(rule, word))
+                for rule, length, exact in zip(self.rules, self.output_lengths(len(word)), self.ascii_rules)]
+    
+    def output_lengths(self, length: int) -> List[int]:
+        """Candidate length produced by each rule for an ASCII word of the given length (see ascii_rules)"""
+        lengths = []
+        for rule in self.rules:
+            result = length
+            for operation, args in rule:
+                result = _output_length(operation, args, result)
+            lengths.append(result)
+        return lengths
+
+def parse_rule(text: str) -> List[Tuple[str, tuple]]:
+    """Tokenize one rule line into (function, arguments) pairs"""
+    tokens = []
+    i = 0
+    
+    while i < len(text):
+        function = text[i]
+        i += 1
+        
+        if function in ' \t':
+            continue
+        
+        if function in SIMPLE_FUNCTIONS:
+            tokens.append((function, ()))
+        elif function in '$^':
+            if i >= len(text):
+                raise ValueError(f"'{function}' needs a character")
+            tokens.append((function, (text[i],)))
+            i += 1
+        elif function == 's':
+            if i + 1 >= len(text):
+                raise ValueError("'s' needs two characters")
+            tokens.append((function, (text[i], text[i + 1])))
+            i += 2
+        elif function == 'T':
+            if i >= len(text) or text[i] not in POSITIONS:
+                raise ValueError("'T' needs a position (0-9, A-Z)")
+            tokens.append((function, (POSITIONS.index(text[i]),)))
+            i += 1
+        else:
+            raise ValueError(f"unknown rule function '{function}'")
+    
+    return tokens
+
+def compile_rule(text: str) -> List[Operation]:
+    """Parse a rule and fold runs of appends, prepends and substitutions into single operations"""
+    operations = []
+    
+    for function, args in parse_rule(text):
+        previous = operations[-1] if operations else (None, ())
+        
+        if function == '$':
+            if previous[0] is _append:
+                operations[-1] = (_append, (previous[1][0] + args[0],))
+            else:
+                operations.append((_append, args))
+        elif function == '^':
+            # Each prepend lands in front of the previous one
+            if previous[0] is _prepend:
+                operations[-1] = (_prepend, (args[0] + previous[1][0],))
+            else:
+                operations.append((_prepend, args))
+        elif function == 's':
+            source, target = args
+            if previous[0] is _translate:
+                table = _compose_substitution(previous[1][0], source, target)
+                operations[-1] = (_translate, (table,))
+            else:
+                operations.append((_translate, ({ord(source): target},)))
+        elif function == 'T':
+            operations.append((_toggle_at, args))
+        elif function != ':':
+            operations.append((SIMPLE_FUNCTIONS[function], ()))
+    
+    return operations
+
+def _compose_substitution(table: Dict[int, str], source: str, target: str) -> Dict[int, str]:
+    """Fold a following sXY into an existing translate table, keeping sequential semantics"""
+    composed = {key: (target if value == source else value) for key, value in table.items()}
+    composed.setdefault(ord(source), target)
+    return composed
+
+def compile_rules(lines: Iterable[str]) -> RuleSet:
+    """Compile rule lines, skipping blanks and comments"""
+    rules = []
+    sources = []
+    
+    for line_number, line in enumerate(lines, 1):
+        text = line.rstrip('\r\n')
+        if not text.strip() or text.lstrip().startswith('#'):
+            continue
+        
+        try:
+            rules.append(compile_rule(text))
+        except ValueError as e:
+            raise click.ClickException(f"Invalid rule on line {line_number} ({text.strip()}): {e}")
+        sources.append(text.strip())
+    
+    return RuleSet(rules, sources)
+
+def load_rules(path: str) -> RuleSet:
+    """Load and compile a rule file"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return compile_rules(f)
+    except OSError as e:
+        raise click.ClickException(f"Could not load rule file: {e}")
\ No newline at end of file
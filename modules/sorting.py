@@ -0,0 +1,187 @@
+"""
+External (disk-backed) sorting for candidate streams
+"""
+
+import heapq
+import os
+import re
+import shutil
+import sys
+import tempfile
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Default amount of memory a single in-memory run may occupy before it is spilled
+DEFAULT_RUN_MEMORY = 256 * 1024 * 1024
+
+# Rough per-entry cost of holding a string in a Python list (object + pointer)
+LIST_SLOT_OVERHEAD = 8
+
+# Most run files merged (and open) at once; more runs are merged in several passes
+MAX_MERGE_FANIN = 64
+
+# Bounds of the per-file read/write buffer during merges, which otherwise comes from the memory budget
+MIN_MERGE_BUFFER = 16 * 1024
+MAX_MERGE_BUFFER = 1024 * 1024
+
+_DIGIT_RE = re.compile(r'\d')
+_SPECIAL_RE = re.compile(r'[^A-Za-z0-9]')
+
+def length_key(candidate: str) -> Tuple[int, str]:
+    """Shortest candidates first, alphabetical within a length"""
+    return (len(candidate), candidate)
+
+def priority_key(candidate: str) -> Tuple[int, int, str]:
+    """Plain words first, then candidates mixing in digits and/or special characters"""
+    classes = (_DIGIT_RE.search(candidate) is not None) + (_SPECIAL_RE.search(candidate) is not None)
+    return (classes, len(candidate), candidate)
+
+# Every key ends with the candidate itself so equal strings stay adjacent after sorting
+ORDER_KEYS = {
+    'lex': None,
+    'length': length_key,
+    'priority': priority_key
+}
+
+class ExternalSorter:
+    """Sort an unbounded stream of strings using sorted runs spilled to disk"""
+    
+    def __init__(self, max_memory: Optional[int] = None, unique: bool = False, temp_dir: Optional[str] = None,
+                 key: Optional[Callable[[str], object]] = None, order: str = 'lex'):
+        self.max_memory = max_memory or DEFAULT_RUN_MEMORY
+        self.unique = unique
+        self.key = key
+        self.order = order
+        self.temp_dir = temp_dir
+        self.runs_spilled = 0
+        self.peak_memory = 0
+        self.items_in = 0
+        self.items_out = 0
+    
+    def sort(self, items: Iterable[str]) -> Iterator[str]:
+        """Yield items in sorted order, spilling runs to disk whenever the buffer is full"""
+        work_dir = tempfile.mkdtemp(prefix='cyberwordlist-sort-', dir=self.temp_dir)
+        run_paths = []
+        
+        try:
+            buffer = []
+            buffered_bytes = 0
+            
+            for item in items:
+                self.items_in += 1
+                buffer.append(item)
+                buffered_bytes += sys.getsizeof(item) + LIST_SLOT_OVERHEAD
+                
+                if buffered_bytes >= self.max_memory:
+                    self.peak_memory = max(self.peak_memory, buffered_bytes)
+                    run_paths.append(self._spill_run(buffer, work_dir, len(run_paths)))
+                    buffer = []
+                    buffered_bytes = 0
+            
+            self.peak_memory = max(self.peak_memory, buffered_bytes)
+            
+            # Everything fitted in one run: no need to touch the disk at all
+            if not run_paths:
+                buffer.sort(key=self.key)
+                yield from self._emit(buffer)
+                return
+            
+            if buffer:
+                run_paths.append(self._spill_run(buffer, work_dir, len(run_paths)))
+                buffer = []
+            
+            yield from self._emit(self._merge_runs(run_paths, work_dir))
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    
+    def memory_usage(self) -> int:
+        """Peak number of bytes held in memory by a single run"""
+        return self.peak_memory
+    
+    def statistics(self) -> Dict:
+        """Summary of the sorting pass"""
+        return {
+            'order': self.order,
+            'items': self.items_out,
+            'runs_spilled': self.runs_spilled,
+            'memory_bytes': self.peak_memory
+        }
+    
+    def _spill_run(self, buffer: List[str], work_dir: str, index: int) -> str:
+        """Sort a buffer and write it to a run file"""
+        buffer.sort(key=self.key)
+        path = os.path.join(work_dir, f'run-{index:05d}.txt')
+        self._write_run(buffer, path, self._merge_fanin()[1])
+        
+        self.runs_spilled += 1
+        return path
+    
+    def _write_run(self, items: Iterable[str], path: str, buffering: int) -> None:
+        with open(path, 'w', encoding='utf-8', buffering=buffering) as f:
+            f.writelines(item + '\n' for item in self._dedup_sorted(items))
+    
+    def _merge_fanin(self) -> Tuple[int, int]:
+        """Runs merged at once and the buffer size per run file, both within the memory budget"""
+        fanin = max(2, min(MAX_MERGE_FANIN, self.max_memory // MIN_MERGE_BUFFER - 1))
+        # One buffer per input plus one for the intermediate run being written
+        buffering = max(MIN_MERGE_BUFFER, min(MAX_MERGE_BUFFER, self.max_memory // (fanin + 1)))
+        return fanin, buffering
+    
+    def _merge_runs(self, run_paths: List[str], work_dir: str) -> Iterator[str]:
+        """k-way merge of sorted run files, in several passes when there are too many to open at once
+        
+        Each pass merges groups of fanin runs into intermediate runs until one group is
+        left, so open files and read buffers stay bounded by the memory budget.
+        """
+        fanin, buffering = self._merge_fanin()
+        merge_pass = 0
+        
+        while len(run_paths) > fanin:
+            merged_paths = []
+            for index in range(0, len(run_paths), fanin):
+                group = run_paths[index:index + fanin]
+                path = os.path.join(work_dir, f'merge-{merge_pass:03d}-{len(merged_paths):05d}.txt')
+                self._write_run(self._merge_group(group, buffering), path, buffering)
+                for merged in group:
+                    os.remove(merged)
+                merged_paths.append(path)
+            run_paths = merged_paths
+            merge_pass += 1
+        
+        yield from self._merge_group(run_paths, buffering)
+    
+    def _merge_group(self, run_paths: List[str], buffering: int) -> Iterator[str]:
+        """k-way merge of a group of sorted run files"""
+        files = [open(path, 'r', encoding='utf-8', buffering=buffering) for path in run_paths]
+        
+        try:
+            streams = [(line[:-1] for line in f) for f in files]
+            yield from heapq.merge(*streams, key=self.key)
+        finally:
+            for f in files:
+                f.close()
+    
+    def _emit(self, items: Iterable[str]) -> Iterator[str]:
+        """Yield sorted items, collapsing adjacent duplicates in unique mode"""
+        for item in self._dedup_sorted(items):
+            self.items_out += 1
+            yield item
+    
+    def _dedup_sorted(self, items: Iterable[str]) -> Iterator[str]:
+        """Drop adjacent repeats from an already sorted sequence when unique is set"""
+        if not self.unique:
+            yield from items
+            return
+        
+        previous = None
+        for item in items:
+            if item != previous:
+                yield item
+                previous = item
+
+def create_sorter(order: str = 'lex', max_memory_mb: Optional[int] = None, unique: bool = False) -> Optional[ExternalSorter]:
+    """Build an ordering stage by name; 'none' keeps generation order"""
+    if order == 'none':
+        return None
+    
+    max_memory = max_memory_mb * 1024 * 1024 if max_memory_mb else None
+    return ExternalSorter(max_memory=max_memory, unique=unique, key=ORDER_KEYS[order], order=order)
\ No newline at end of file
@@ -0,0 +1,120 @@
+"""
+Packed in-memory candidate store
+"""
+
+import itertools
+from array import array
+from typing import BinaryIO, Iterable, Iterator, List, Union
+from modules.writers import CHUNK_LINES, iter_chunks
+
+# Offsets start as 32-bit and are widened once the buffer outgrows them
+OFFSET_LIMIT = 2 ** 32 - 1
+
+class PackedWordlist:
+    """Read-only sequence of passwords stored as one newline-joined UTF-8 buffer
+    
+    A list of str costs roughly 57 bytes of object and list overhead per password on top
+    of its characters; here each password costs its encoded bytes, one newline and a
+    4-byte offset. Entry i spans data[offsets[i]:offsets[i + 1]] including its trailing
+    newline, so any contiguous range is already in wordlist file format and can be
+    written out without copying. Slices are views sharing the same buffers.
+    """
+    
+    def __init__(self, data: bytearray, offsets: array, is_sorted: bool = False,
+                 start: int = 0, stop: int = None):
+        self.data = data
+        self.offsets = offsets
+        self.is_sorted = is_sorted
+        self.start = start
+        self.stop = len(offsets) - 1 if stop is None else stop
+    
+    @classmethod
+    def from_iterable(cls, passwords: Iterable[str], is_sorted: bool = False) -> 'PackedWordlist':
+        """Pack passwords chunk by chunk, without holding a second list of them"""
+        data = bytearray()
+        offsets = array('I', [0])
+        
+        for chunk in iter_chunks(passwords):
+            encoded = ('\n'.join(chunk) + '\n').encode('utf-8')
+            if len(encoded) == sum(map(len, chunk)) + len(chunk):
+                sizes = [len(password) + 1 for password in chunk]
+            else:
+                sizes = [len(password.encode('utf-8')) + 1 for password in chunk]
+            
+            if len(data) + len(encoded) > OFFSET_LIMIT and offsets.typecode == 'I':
+                offsets = array('Q', offsets)
+            offsets.extend(itertools.islice(itertools.accumulate(sizes, initial=len(data)), 1, None))
+            data += encoded
+        
+        return cls(data, offsets, is_sorted)
+    
+    def __len__(self) -> int:
+        return self.stop - self.start
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, 'PackedWordlist', List[str]]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return PackedWordlist(self.data, self.offsets, self.is_sorted,
+                                  self.start + start, self.start + max(start, stop))
+        
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('PackedWordlist index out of range')
+        return self._entry(self.start + index).decode('utf-8')
+    
+    def __iter__(self) -> Iterator[str]:
+        for chunk in self.chunks():
+            yield from chunk
+    
+    def __contains__(self, password: str) -> bool:
+        if self.is_sorted:
+            index = self.bisect(password)
+            return index < len(self) and self[index] == password
+        return any(password in chunk for chunk in self.chunks())
+    
+    def chunks(self, size: int = CHUNK_LINES) -> Iterator[List[str]]:
+        """Decode the passwords a chunk at a time (one decode and split per chunk)"""
+        offsets = self.offsets
+        view = memoryview(self.data)
+        for first in range(self.start, self.stop, size):
+            last = min(first + size, self.stop)
+            yield str(view[offsets[first]:offsets[last] - 1], 'utf-8').split('\n')
+    
+    def bisect(self, password: str) -> int:
+        """Index of the first entry not less than password (sorted stores only)
+        
+        UTF-8 byte order matches code point order, so entries are compared as bytes
+        without decoding them.
+        """
+        if not self.is_sorted:
+            raise ValueError('bisect needs a sorted PackedWordlist')
+        
+        target = password.encode('utf-8')
+        low, high = self.start, self.stop
+        while low < high:
+            middle = (low + high) // 2
+            if self._entry(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        return low - self.start
+    
+    def buffer(self) -> memoryview:
+        """The stored passwords as newline-terminated UTF-8, without copying"""
+        return memoryview(self.data)[self.offsets[self.start]:self.offsets[self.stop]]
+    
+    def write_to(self, f: BinaryIO) -> int:
+        """Write every password to a binary file in one call, returning the count"""
+        f.write(self.buffer())
+        return len(self)
+    
+    def memory_usage(self) -> int:
+        """Bytes held by the buffer and the offsets index"""
+        return len(self.data) + len(self.offsets) * self.offsets.itemsize
+    
+    def _entry(self, index: int) -> bytearray:
+        """Encoded entry without its newline"""
+        return self.data[self.offsets[index]:self.offsets[index + 1] - 1]
\ No newline at end of file
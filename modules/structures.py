@@ -0,0 +1,163 @@
+"""
+Structure (PCFG-style) candidates learned from a sample of passwords
+"""
+
+import hashlib
+import heapq
+import itertools
+import json
+import math
+from collections import Counter, defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple
+import click
+from modules.ranking import character_classes
+
+# Most frequent templates kept from the sample
+MAX_TEMPLATES = 500
+
+# Most frequent digit and symbol strings kept per segment length
+MAX_TERMINALS = 100
+
+# Default number of structure candidates generated per target
+DEFAULT_STRUCTURE_LIMIT = 100000
+
+# Letter segment spellings: L lowercase, C capitalized, U uppercase
+_CASES = {
+    'L': str.lower,
+    'C': str.capitalize,
+    'U': str.upper
+}
+
+def template_of(password: str) -> Optional[Tuple[str, ...]]:
+    """Segments like ('C5', 'D4', 'S1') for 'Alice1990!', or None for mixed-case words"""
+    segments = []
+    for kind, group in itertools.groupby(character_classes(password), key=lambda char: 'A' if char in 'UL' else char):
+        classes = ''.join(group)
+        if kind != 'A':
+            segments.append(f'{kind}{len(classes)}')
+        elif classes == 'L' * len(classes):
+            segments.append(f'L{len(classes)}')
+        elif classes == 'U' * len(classes):
+            segments.append(f'U{len(classes)}')
+        elif classes == 'U' + 'L' * (len(classes) - 1):
+            segments.append(f'C{len(classes)}')
+        else:
+            return None
+    return tuple(segments)
+
+class StructureModel:
+    """Template and terminal frequencies, filled with a target's words in probability order"""
+    
+    def __init__(self, templates: List[Tuple[float, Tuple[str, ...]]], terminals: Dict[str, List[Tuple[str, float]]]):
+        self.templates = templates
+        self.terminals = terminals
+    
+    @classmethod
+    def learn(cls, path: str) -> 'StructureModel':
+        """Learn templates and digit/symbol terminals from a file of example passwords"""
+        templates = Counter()
+        terminals = defaultdict(Counter)
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    password = line.rstrip('\r\n')
+                    template = template_of(password) if password else None
+                    if template is None:
+                        continue
+                    templates[template] += 1
+                    
+                    position = 0
+                    for segment in template:
+                        size = int(segment[1:])
+                        if segment[0] in 'DS':
+                            terminals[segment][password[position:position + size]] += 1
+                        position += size
+        except OSError as e:
+            raise click.ClickException(f"Could not load structure sample: {e}")
+        
+        if not templates:
+            raise click.ClickException(f"Structure sample {path} contains no usable passwords")
+        
+        total = sum(templates.values())
+        return cls(
+            [(math.log(count / total), template) for template, count in templates.most_common(MAX_TEMPLATES)],
+            {segment: cls._log_probabilities(counts.most_common(MAX_TERMINALS)) for segment, counts in terminals.items()}
+        )
+    
+    def digest(self) -> str:
+        """SHA-256 of the learned tables, for cache keys and run fingerprints"""
+        encoded = json.dumps([self.templates, self.terminals], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _log_probabilities(counts: List[Tuple[str, int]]) -> List[Tuple[str, float]]:
+        total = sum(count for _, count in counts)
+        return [(terminal, math.log(count / total)) for terminal, count in counts]
+    
+    def generate(self, base_words: List[str], dates: List[str], min_len: int, max_len: int,
+                 limit: Optional[int] = None) -> Iterator[str]:
+        """Yield up to limit candidates (default DEFAULT_STRUCTURE_LIMIT), best first by a PCFG "next" walk"""
+        if limit is None:
+            limit = DEFAULT_STRUCTURE_LIMIT
+        slots = self._target_slots(base_words, dates)
+        
+        # One heap entry per template to start with: every slot at its most likely terminal
+        heap = []
+        for template_index, (template_score, template) in enumerate(self.templates):
+            length = sum(int(segment[1:]) for segment in template)
+            if not min_len <= length <= max_len or not all(slots.get(segment) for segment in template):
+                continue
+            indices = (0,) * len(template)
+            score = template_score + sum(slots[segment][0][1] for segment in template)
+            heap.append((-score, template_index, indices, 0))
+        heapq.heapify(heap)
+        
+        produced = 0
+        while heap and produced < limit:
+            negative_score, template_index, indices, pivot = heapq.heappop(heap)
+            template = self.templates[template_index][1]
+            yield ''.join(slots[segment][index][0] for segment, index in zip(template, indices))
+            produced += 1
+            
+            # Advance one slot at or after the pivot, so each combination is queued once
+            for position in range(pivot, len(template)):
+                terminals = slots[template[position]]
+                index = indices[position]
+                if index + 1 < len(terminals):
+                    child = indices[:position] + (index + 1,) + indices[position + 1:]
+                    score = -negative_score - terminals[index][1] + terminals[index + 1][1]
+                    heapq.heappush(heap, (-score, template_index, child, position))
+    
+    def words_by_length(self, base_words: List[str]) -> Dict[int, List[str]]:
+        """Lowercased alphabetic base words per length a letter segment uses: all of generate()'s word input"""
+        sizes = {int(segment[1:]) for _, template in self.templates for segment in template if segment[0] in _CASES}
+        words_by_length = defaultdict(list)
+        for word in base_words:
+            if word.isalpha() and len(word) in sizes:
+                words_by_length[len(word)].append(word.lower())
+        return dict(words_by_length)
+    
+    def _target_slots(self, base_words: List[str], dates: List[str]) -> Dict[str, List[Tuple[str, float]]]:
+        """Terminal lists for every segment of the kept templates, filled for one target"""
+        words_by_length = self.words_by_length(base_words)
+        
+        dates_by_length = defaultdict(list)
+        for date in dict.fromkeys(dates):
+            dates_by_length[len(date)].append(date)
+        
+        slots = {}
+        for segment in {segment for _, template in self.templates for segment in template}:
+            kind, size = segment[0], int(segment[1:])
+            if kind in _CASES:
+                words = list(dict.fromkeys(_CASES[kind](word) for word in words_by_length.get(size, [])))
+                slots[segment] = [(word, -math.log(len(words))) for word in words]
+            elif kind == 'D' and dates_by_length.get(size):
+                # The target's own dates rank with the most common learned digits
+                learned = self.terminals.get(segment, [])
+                top = learned[0][1] if learned else 0.0
+                target = [(date, top) for date in dates_by_length[size]]
+                seen = {date for date, _ in target}
+                slots[segment] = target + [(terminal, score) for terminal, score in learned if terminal not in seen]
+            else:
+                slots[segment] = self.terminals.get(segment, [])
+        return slots
\ No newline at end of file
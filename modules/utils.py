@@ -52,28 +52,13 @@ def format_number(num: int) -> str:
     """Format number with thousands separator"""
     return f"{num:,}"
 
-def estimate_generation_time(base_words: int, options: dict) -> str:
-    """Estimate wordlist generation time"""
-    # Simple estimation based on options and base words
-    complexity_factor = 1
-    
-    if options.get('include_combinations', True):
-        complexity_factor *= 2
-    if options.get('include_leet_speak', True):
-        complexity_factor *= 1.5
-    if options.get('include_dates', True):
-        complexity_factor *= 1.3
-    
-    estimated_passwords = base_words * complexity_factor * 10
-    
-    if estimated_passwords < 1000:
-        return "< 1 second"
-    elif estimated_passwords < 10000:
-        return "1-5 seconds"
-    elif estimated_passwords < 100000:
-        return "5-30 seconds"
-    else:
-        return "30+ seconds"
+def format_bytes(num: float) -> str:
+    """Format a byte count with a binary unit"""
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if num < 1024:
+            return f"{num:.1f} {unit}"
+        num /= 1024
+    return f"{num:.1f} TB"
 
 def validate_date_format(date_str: str) -> bool:
     """Validate date string format (DDMMYYYY)"""
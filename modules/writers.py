@@ -0,0 +1,240 @@
+"""
+High-throughput writers for wordlist output
+"""
+
+import bz2
+import functools
+import gzip
+import io
+import itertools
+import lzma
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional
+import click
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Candidates joined and encoded together per write call
+CHUNK_LINES = 65536
+
+# Buffer size for output files (large writes matter most on network filesystems)
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Uncompressed bytes per independently compressed block in multi-threaded mode
+COMPRESS_BLOCK_SIZE = 8 * 1024 * 1024
+
+COMPRESSION_FORMATS = ['gz', 'xz', 'bz2', 'zst']
+
+# Output name that sends the wordlist to standard output
+STDOUT = '-'
+
+DEFAULT_COMPRESS_LEVELS = {
+    'gz': 6,
+    'xz': 6,
+    'bz2': 9,
+    'zst': 3
+}
+
+# Inclusive level range each codec accepts
+COMPRESS_LEVEL_RANGES = {
+    'gz': (0, 9),
+    'xz': (0, 9),
+    'bz2': (1, 9),
+    'zst': (1, 22)
+}
+
+def iter_chunks(items: Iterable[str], size: int = CHUNK_LINES) -> Iterator[List[str]]:
+    """Split an iterable into lists of at most `size` items"""
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+class ChunkedWriter:
+    """Writes newline-terminated UTF-8 lines in large pre-encoded chunks
+    
+    Each chunk is joined and encoded once and handed to the binary file in a single
+    write, instead of one encode and one write per line. Only the time spent encoding
+    and writing is measured, so the throughput figures are not skewed by a lazy
+    candidate stream feeding the writer. on_chunk, when given, is called with the writer
+    after every chunk of lines.
+    """
+    
+    def __init__(self, f: BinaryIO, chunk_lines: int = CHUNK_LINES,
+                 on_chunk: Optional[Callable[['ChunkedWriter'], None]] = None):
+        self.f = f
+        self.chunk_lines = chunk_lines
+        self.on_chunk = on_chunk
+        self.lines = 0
+        self.bytes = 0
+        self.seconds = 0.0
+    
+    def write_lines(self, lines: Iterable[str]) -> int:
+        """Write every line, returning how many were written"""
+        written = 0
+        for chunk in iter_chunks(lines, self.chunk_lines):
+            self.write_chunk(chunk)
+            written += len(chunk)
+        return written
+    
+    def write_chunk(self, chunk: List[str]) -> None:
+        """Encode and write one chunk of lines"""
+        started = time.perf_counter()
+        data = ('\n'.join(chunk) + '\n').encode('utf-8')
+        self.f.write(data)
+        self.seconds += time.perf_counter() - started
+        self.lines += len(chunk)
+        self.bytes += len(data)
+        if self.on_chunk is not None:
+            self.on_chunk(self)
+    
+    def write_raw(self, data: bytes, lines: int = 0) -> None:
+        """Write already encoded bytes (headers, footers, pre-formatted chunks)"""
+        started = time.perf_counter()
+        self.f.write(data)
+        self.seconds += time.perf_counter() - started
+        self.lines += lines
+        self.bytes += len(data)
+    
+    def statistics(self) -> Dict:
+        """Lines, bytes and write time of everything written so far"""
+        return {
+            'lines': self.lines,
+            'bytes': self.bytes,
+            'seconds': self.seconds
+        }
+
+class BlockCompressor(io.RawIOBase):
+    """Write-only file object compressing fixed-size blocks on a thread pool
+    
+    gzip, bzip2 and xz all allow a file to be a concatenation of complete streams, and
+    zlib, bz2 and lzma release the GIL while compressing, so independent blocks can be
+    compressed in parallel and written in order. Standard tools decompress the result
+    as one file.
+    """
+    
+    def __init__(self, path: str, compress: functools.partial, threads: int,
+                 block_size: int = COMPRESS_BLOCK_SIZE):
+        super().__init__()
+        self._file = open(path, 'wb', buffering=WRITE_BUFFER_SIZE)
+        self._compress = compress
+        self._executor = ThreadPoolExecutor(max_workers=threads)
+        self._pending = deque()
+        self._max_pending = threads * 2
+        self._buffer = []
+        self._buffered = 0
+        self._block_size = block_size
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data: bytes) -> int:
+        self._buffer.append(bytes(data))
+        self._buffered += len(data)
+        if self._buffered >= self._block_size:
+            self._submit()
+        return len(data)
+    
+    def close(self) -> None:
+        if self.closed:
+            return
+        
+        try:
+            if self._buffered:
+                self._submit()
+            while self._pending:
+                self._file.write(self._pending.popleft().result())
+        finally:
+            self._executor.shutdown()
+            self._file.close()
+            super().close()
+    
+    def _submit(self) -> None:
+        """Queue the buffered block, writing finished blocks to keep memory bounded"""
+        block = b''.join(self._buffer)
+        self._buffer = []
+        self._buffered = 0
+        self._pending.append(self._executor.submit(self._compress, block))
+        
+        while len(self._pending) > self._max_pending:
+            self._file.write(self._pending.popleft().result())
+
+def check_compress_level(compress: Optional[str], level: Optional[int]) -> None:
+    """Reject a compression level outside the codec's range with click.BadParameter"""
+    if compress is None or level is None:
+        return
+    low, high = COMPRESS_LEVEL_RANGES[compress]
+    if not low <= level <= high:
+        raise click.BadParameter(f"{compress} takes levels {low}-{high}, got {level}",
+                                 param_hint="'--compress-level'")
+
+def open_output(path: str, compress: Optional[str] = None, level: Optional[int] = None,
+                threads: int = 1, append: bool = False) -> BinaryIO:
+    """Open a binary output file, optionally through a streaming compressor
+    
+    append (uncompressed output only) adds to the end of an existing file. The path
+    STDOUT writes to standard output instead.
+    """
+    if path == STDOUT:
+        if compress is not None or append:
+            raise click.ClickException("Standard output takes uncompressed, non-appended output only")
+        return open_stdout()
+    
+    if compress is None:
+        return open(path, 'ab' if append else 'wb', buffering=WRITE_BUFFER_SIZE)
+    
+    if append:
+        raise click.ClickException("Appending to compressed output is not supported")
+    
+    # Checked before the file is created so a bad level leaves nothing behind
+    check_compress_level(compress, level)
+    if level is None:
+        level = DEFAULT_COMPRESS_LEVELS[compress]
+    
+    if compress == 'zst':
+        if zstandard is None:
+            raise click.ClickException("zstd compression requires the 'zstandard' package (pip install zstandard)")
+        # zstd runs its own worker threads; 0 compresses on the calling thread
+        compressor = zstandard.ZstdCompressor(level=level, threads=threads if threads > 1 else 0)
+        return compressor.stream_writer(open(path, 'wb', buffering=WRITE_BUFFER_SIZE), closefd=True)
+    
+    if threads > 1:
+        block_codecs = {
+            'gz': functools.partial(gzip.compress, compresslevel=level),
+            'bz2': functools.partial(bz2.compress, compresslevel=level),
+            'xz': functools.partial(lzma.compress, preset=level)
+        }
+        return BlockCompressor(path, block_codecs[compress], threads)
+    
+    if compress == 'gz':
+        return gzip.open(path, 'wb', compresslevel=level)
+    if compress == 'bz2':
+        return bz2.open(path, 'wb', compresslevel=level)
+    return lzma.open(path, 'wb', preset=level)
+
+def open_stdout() -> BinaryIO:
+    """Standard output as a binary stream with a large buffer (closing it leaves stdout open)"""
+    return open(sys.__stdout__.fileno(), 'wb', buffering=WRITE_BUFFER_SIZE, closefd=False)
+
+def discard_stdout() -> None:
+    """Point stdout at the null device once a pipe's reader is gone, so flushing on exit cannot fail again"""
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.__stdout__.fileno())
+    os.close(devnull)
+
+def fsync_path(path: str) -> None:
+    """fsync a file that has already been written and closed"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
\ No newline at end of file
@@ -0,0 +1,19 @@
+"""
+Tests for batch character-class analysis
+"""
+
+from modules.analysis import CharClassAnalyzer
+
+def test_unicode_digits_match_str_isdigit():
+    batch = ['pass²', 'x³y', 'café', 'naïve!', 'ab١', 'é9#']
+    lengths, flags = CharClassAnalyzer().analyze(batch)
+    assert lengths == [5, 3, 4, 6, 3, 3]
+    assert flags == [1, 1, 0, 2, 1, 3]
+    for password, flag in zip(batch, flags):
+        assert bool(flag & 1) == any(c.isdigit() for c in password)
+
+def test_ascii_paths_agree():
+    batch = ['password', 'pass123', 'p@ss', 'P@ss1', '']
+    expected = CharClassAnalyzer(use_numpy=False).analyze(batch)
+    assert expected == ([8, 7, 4, 5, 0], [0, 1, 2, 3, 0])
+    assert CharClassAnalyzer(use_numpy=True).analyze(batch[:-1]) == (expected[0][:-1], expected[1][:-1])
\ No newline at end of file
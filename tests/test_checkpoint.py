@@ -0,0 +1,34 @@
+"""
+Tests for checkpointed streamed runs and --resume
+"""
+
+import os
+from click.testing import CliRunner
+from cyberwordlist import main
+from modules.checkpoint import Checkpointer
+
+CONFIG = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'example_config.json')
+
+def test_resumed_run_is_byte_identical(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    arguments = ['-q', '--no-cache', '-c', CONFIG, '--stream']
+    
+    assert runner.invoke(main, arguments + ['-o', 'full.txt']).exit_code == 0
+    
+    # Checkpoint after the first chunk, then crash with a half-written line behind it
+    def crash(self, writer):
+        self.save(writer)
+        writer.f.write('partial-li'.encode('utf-8'))
+        raise KeyboardInterrupt
+    
+    with monkeypatch.context() as patch:
+        patch.setattr(Checkpointer, 'after_chunk', crash)
+        assert runner.invoke(main, arguments + ['-o', 'resumed.txt']).exit_code == 1
+    assert os.path.exists('resumed.txt.checkpoint.json')
+    assert os.path.getsize('resumed.txt') < os.path.getsize('full.txt')
+    
+    assert runner.invoke(main, arguments + ['-o', 'resumed.txt', '--resume']).exit_code == 0
+    with open('full.txt', 'rb') as full, open('resumed.txt', 'rb') as resumed:
+        assert resumed.read() == full.read()
+    assert not os.path.exists('resumed.txt.checkpoint.json')
\ No newline at end of file
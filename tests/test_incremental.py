@@ -0,0 +1,71 @@
+"""
+Tests for incremental regeneration of edited profiles
+"""
+
+import json
+import os
+from click.testing import CliRunner
+from cyberwordlist import main
+from modules.generator import WordlistGenerator
+from modules.structures import StructureModel
+
+CONFIG = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'example_config.json')
+
+def read_lines(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read().splitlines()
+
+def test_delta_plus_previous_list_equals_full_regeneration(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with open(CONFIG, encoding='utf-8') as f:
+        data = json.load(f)
+    
+    def run(*arguments):
+        result = CliRunner().invoke(main, ['-q', '--no-cache', '-c', 'target.json', *arguments])
+        assert result.exit_code == 0, result.output
+    
+    # First run without two of the keywords and a hobby
+    added = {'keywords': ['crypto', 'python'], 'hobbies': ['chess']}
+    edited = json.loads(json.dumps(data))
+    edited['personal_info']['keywords'] = [word for word in data['personal_info']['keywords']
+                                           if word not in added['keywords']]
+    edited['recon_info']['hobbies'] = [word for word in data['recon_info']['hobbies'] if word not in added['hobbies']]
+    with open('target.json', 'w', encoding='utf-8') as f:
+        json.dump(edited, f)
+    run('-o', 'wordlist.txt', '--incremental')
+    previous = read_lines('wordlist.txt')
+    
+    # Then with the full profile: only the delta is appended
+    with open('target.json', 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    run('-o', 'wordlist.txt', '--incremental')
+    run('-o', 'full.txt')
+    
+    extended = read_lines('wordlist.txt')
+    full = read_lines('full.txt')
+    assert extended[:len(previous)] == previous
+    assert len(extended) > len(previous)
+    assert len(set(extended)) == len(extended)
+    assert sorted(extended) == sorted(full)
+
+def test_delta_reruns_structures_only_when_their_words_change(tmp_path, monkeypatch):
+    sample = tmp_path / 'sample.txt'
+    sample.write_text('Alice1990!\njohn123\nDragon2020\nhacker99\nmonkey\nSummer2024!\n', encoding='utf-8')
+    generator = WordlistGenerator(structures=StructureModel.learn(str(sample)))
+    with open(CONFIG, encoding='utf-8') as f:
+        data = json.load(f)
+    previous_words = generator._extract_base_words(data['personal_info'], data['social_media'], data['recon_info'])
+    
+    calls = []
+    original = generator._generate_structures
+    monkeypatch.setattr(generator, '_generate_structures', lambda *args: calls.append(args) or original(*args))
+    
+    # A word no letter segment can take leaves the structure candidates as they were
+    for keyword, runs in [('abc123', 0), ('zebra', 1)]:
+        calls.clear()
+        edited = json.loads(json.dumps(data))
+        edited['personal_info']['keywords'].append(keyword)
+        result = generator.generate_delta(edited['personal_info'], edited['social_media'], edited['recon_info'],
+                                          edited['options'], previous_words)
+        assert keyword in result['added_words']
+        assert len(calls) == runs
\ No newline at end of file
@@ -0,0 +1,50 @@
+"""
+Tests for the exact generation planner
+"""
+
+import json
+import os
+import pytest
+from modules.generator import WordlistGenerator
+from modules.planner import GenerationPlanner
+from modules.rules import compile_rules, load_rules
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def load_profile():
+    with open(os.path.join(ROOT, 'example_config.json'), encoding='utf-8') as f:
+        return json.load(f)
+
+@pytest.mark.parametrize('rules, options', [
+    (False, {}),
+    (False, {'min_length': 8, 'max_length': 12, 'leet_max_substitutions': 2}),
+    (False, {'include_numbers': False, 'include_special_chars': False, 'include_dates': False}),
+    (True, {'min_length': 6}),
+    (['u', 'c $!', 'T0 $ß u', 'd'], {'min_length': 6, 'max_length': 12})
+])
+def test_plan_counts_match_generated_phases(rules, options):
+    data = load_profile()
+    data['options'].update(options)
+    # Case changes of these words change their length
+    data['personal_info']['keywords'] += ['straße', 'İstanbul']
+    if rules is True:
+        rules = load_rules(os.path.join(ROOT, 'example.rule'))
+    elif rules:
+        rules = compile_rules(rules)
+    generator = WordlistGenerator(rules=rules or None)
+    
+    plan = GenerationPlanner(generator).plan(data['personal_info'], data['social_media'], data['recon_info'],
+                                             data['options'])
+    
+    base_words = generator._extract_base_words(data['personal_info'], data['social_media'], data['recon_info'])
+    min_length, max_length = data['options']['min_length'], data['options']['max_length']
+    produced = []
+    for name, stream in generator._phase_streams(data['personal_info'], base_words, data['options']):
+        lengths = [len(candidate) for candidate in stream]
+        assert all(min_length <= length <= max_length for length in lengths), name
+        produced.append((name, len(lengths)))
+    assert [(phase['phase'], phase['candidates']) for phase in plan['phases']] == produced
+    
+    result = generator.generate(data['personal_info'], data['social_media'], data['recon_info'], data['options'])
+    assert plan['total_candidates'] == sum(phase['produced'] for phase in result['phase_stats'])
+    assert result['count'] <= plan['total_candidates']
\ No newline at end of file
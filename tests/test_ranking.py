@@ -0,0 +1,25 @@
+"""
+Tests for probability ranking and top-K selection
+"""
+
+import random
+from modules.ranking import rank_candidates
+
+def test_top_k_is_prefix_of_full_ranking():
+    rng = random.Random(7)
+    words = [''.join(rng.choice('abZé') for _ in range(rng.randint(1, 4))) for _ in range(60)]
+    scored = [(rng.choice([0.0, -0.5, -1.0, rng.random()]), rng.choice(words)) for _ in range(500)]
+    full = rank_candidates(scored)
+    for top_k in (1, 5, 17, 50, 1000):
+        assert rank_candidates(scored, top_k) == full[:top_k]
+
+def test_top_k_with_many_rescored_duplicates():
+    # Every candidate comes back several times with a better score, as when phases overlap
+    scored = [(-10.0 + round_ + (index % 7) * 0.01, f'w{index}') for round_ in range(10) for index in range(3000)]
+    scored += [(-30.0, f'w{index}') for index in range(3000)]
+    full = rank_candidates(scored)
+    assert rank_candidates(scored, 1000) == full[:1000]
+    assert rank_candidates(scored, 3000) == full
+
+def test_prefix_ranks_before_its_extensions_on_ties():
+    assert rank_candidates([(0.0, 'abc'), (0.0, 'ab'), (0.0, 'b')], 2) == ['ab', 'abc']
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""
+Tests for the rule engine's length pruning
+"""
+
+import pytest
+from modules.rules import compile_rules
+
+RULES = [':', 'u', 'c', 'C', 't', 'T1', 'd', 'r', ']', '$ß u', '^1 ^2', 'sa4 se3', 'ssß u', '$1 $2 $3']
+WORDS = ['straße', 'İstanbul', 'ŉoël', 'password', 'abc', 'sass', 'x']
+
+@pytest.mark.parametrize('min_length, max_length', [(1, 25), (4, 8), (6, 6), (9, 12)])
+def test_pruned_rules_match_filtered_output(min_length, max_length):
+    rules = compile_rules(RULES)
+    everything = list(rules.apply(WORDS))
+    expected = [candidate for candidate in everything if min_length <= len(candidate) <= max_length]
+    assert list(rules.apply(WORDS, min_length, max_length)) == expected
+
+def test_candidate_lengths_are_exact():
+    rules = compile_rules(RULES)
+    assert not rules.predictable
+    for word in WORDS:
+        expected = []
+        for rule in RULES:
+            produced = list(compile_rules([rule]).apply([word]))
+            expected.append(len(produced[0]) if produced else 0)
+        assert rules.candidate_lengths(word) == expected
+    
+    ascii_rules = compile_rules(['u', 'd', '$1 $2', 'sa4'])
+    assert ascii_rules.predictable
+    assert ascii_rules.candidate_lengths('password') == ascii_rules.output_lengths(len('password'))
\ No newline at end of file
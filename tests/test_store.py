@@ -0,0 +1,47 @@
+"""
+Tests for the packed in-memory result store
+"""
+
+import bisect
+import io
+import pytest
+from modules.store import PackedWordlist
+
+WORDS = sorted(['alice', 'ali', 'alice1990', 'bob', 'café', 'cafe', 'zürich', 'Zeta', '日本語', 'a' * 40])
+
+def test_indexing_and_iteration_match_the_list():
+    packed = PackedWordlist.from_iterable(WORDS, is_sorted=True)
+    assert len(packed) == len(WORDS)
+    assert list(packed) == WORDS
+    assert [packed[i] for i in range(-len(WORDS), len(WORDS))] == WORDS + WORDS
+    with pytest.raises(IndexError):
+        packed[len(WORDS)]
+
+def test_slices_are_views_in_file_format():
+    packed = PackedWordlist.from_iterable(WORDS, is_sorted=True)
+    for start, stop in [(0, 3), (2, 7), (4, 4), (-3, None), (5, 100)]:
+        view = packed[start:stop]
+        assert list(view) == WORDS[start:stop]
+        assert view.data is packed.data
+        assert bytes(view.buffer()) == ''.join(word + '\n' for word in WORDS[start:stop]).encode('utf-8')
+    assert packed[::2] == WORDS[::2]
+    assert list(packed[2:8][1:3]) == WORDS[3:5]
+    
+    f = io.BytesIO()
+    assert packed[1:4].write_to(f) == 3
+    assert f.getvalue().decode('utf-8').splitlines() == WORDS[1:4]
+
+def test_bisect_and_membership_follow_code_point_order():
+    packed = PackedWordlist.from_iterable(WORDS, is_sorted=True)
+    probes = WORDS + ['', 'al', 'alicf', 'caf', 'cafè', 'zz', '日', '日本語語', '\U0001f600']
+    for probe in probes:
+        assert packed.bisect(probe) == bisect.bisect_left(WORDS, probe)
+        assert (probe in packed) == (probe in WORDS)
+    
+    view = packed[3:8]
+    for probe in probes:
+        assert view.bisect(probe) == bisect.bisect_left(WORDS[3:8], probe)
+        assert (probe in view) == (probe in WORDS[3:8])
+    
+    with pytest.raises(ValueError):
+        PackedWordlist.from_iterable(WORDS).bisect('bob')
\ No newline at end of file